@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+import numpy as np
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.timeseries.align import align
+
+
+def calendars(prices, seed=2):
+    # each asset has its own holidays, e.g. 5% of the dates are missing
+    rand = np.random.RandomState(seed)
+    return {asset: prices[asset][rand.rand(len(prices.index)) > 0.05] for asset in prices.keys()}
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.align
+    rows = []
+    for n in [50, 500]:
+        series = calendars(prices(dates=5000, assets=n))
+        rows.append({"assets": n, "align [s]": timeit(lambda: align(series, ffill=True)),
+                     "frame and ffill [s]": timeit(lambda: pd.DataFrame(series).ffill())})
+
+    print(pd.DataFrame(rows).set_index("assets"))
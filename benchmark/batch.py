@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+import numpy as np
+import pandas as pd
+
+from benchmark.universe import prices, weights, timeit
+from pyutil.portfolio.batch import PortfolioBatch
+from pyutil.portfolio.portfolio import Portfolio
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.batch
+    rows = []
+    for n in [10, 100, 1000]:
+        x = prices(dates=1000, assets=20)
+        w = weights(x)
+        tensor = np.stack([w.values * s for s in np.linspace(0.5, 1.5, n)])
+
+        def loop():
+            return [Portfolio(prices=x, weights=pd.DataFrame(index=x.index, columns=x.columns, data=t)).nav.summary() for t in tensor]
+
+        def batch():
+            return PortfolioBatch(prices=x, weights=tensor).summary()
+
+        rows.append({"portfolios": n, "batch [s]": timeit(batch), "loop [s]": timeit(loop, repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("portfolios"))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+import numpy as np
+import pandas as pd
+
+from benchmark.universe import timeit
+from pyutil.performance._drawdown import _Drawdown
+
+
+def tuples(series):
+    # consecutive pairs of down days compared to tuple literals
+    d = _Drawdown(series).drawdown
+    is_down = d > 0
+    s = pd.Series(index=is_down.index[1:], data=[r for r in zip(is_down[:-1], is_down[1:])])
+    start = list(s[s == (False, True)].index)
+    end = list(s[s == (True, False)].index)
+    if len(end) < len(start):
+        end.append(s.index[-1])
+    return pd.Series({s: e - s for s, e in zip(start, end)})
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.drawdown
+    rows = []
+    for n in [10000, 100000, 1000000]:
+        rand = np.random.RandomState(0)
+        series = pd.Series(index=pd.date_range("2015-01-01", periods=n, freq="min"),
+                           data=np.exp(np.cumsum(0.001 * rand.standard_normal(n))))
+
+        rows.append({"minutes": n, "periods [s]": timeit(lambda: _Drawdown(series).periods),
+                     "episodes [s]": timeit(lambda: _Drawdown(series).episodes),
+                     "tuples [s]": timeit(lambda: tuples(series), repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("minutes"))
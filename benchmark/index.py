@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance.summary import NavSeries
+from pyutil.timeseries.merge import to_date
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+    pd.options.display.max_columns = 10
+
+    # python -m benchmark.index
+    rows = []
+    for n in [1000, 8000]:
+        x = prices(dates=n, assets=1)["A0000"]
+        dates = x.rename(index=lambda t: t.date())
+
+        rows.append({"dates": n,
+                     "to_date [s]": timeit(lambda: to_date(x.copy())),
+                     "loop date() [s]": timeit(lambda: pd.Series(index=[a.date() for a in x.index], data=x.values)),
+                     "NavSeries of dates [s]": timeit(lambda: NavSeries(dates)),
+                     "rename Timestamp [s]": timeit(lambda: dates.rename(index=lambda t: pd.Timestamp(t)))})
+
+    print(pd.DataFrame(rows).set_index("dates"))
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, weights, timeit
+from pyutil.portfolio.portfolio import Portfolio
+
+
+def iron_loop(portfolio, threshold=0.02):
+    # the date-by-date pandas implementation we used to run
+    p = portfolio.copy()
+    for yesterday, today in zip(portfolio.index[:-2], portfolio.index[1:-1]):
+        if (p.weights.loc[today] - p.weights.loc[yesterday]).abs().max() <= threshold:
+            p.forward(today, yesterday=yesterday)
+    return p
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.iron
+    rows = []
+    for dates in [250, 1000, 5000]:
+        for assets in [10, 100, 300, 500]:
+            x = prices(dates=dates, assets=assets)
+            portfolio = Portfolio(prices=x, weights=weights(x))
+
+            row = {"dates": dates, "assets": assets,
+                   "threshold [s]": timeit(lambda: portfolio.iron_threshold(threshold=0.02)),
+                   "monthly [s]": timeit(lambda: portfolio.iron_time(rule="M")),
+                   "weekly [s]": timeit(lambda: portfolio.iron_time(rule="W"))}
+
+            # the old loop is far too slow for the larger problems
+            if dates <= 1000 and assets <= 300:
+                row["threshold, date loop [s]"] = timeit(lambda: iron_loop(portfolio, threshold=0.02), repeat=1)
+
+            rows.append(row)
+
+    print(pd.DataFrame(rows).set_index(["dates", "assets"]))
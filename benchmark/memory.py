@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+import gc
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmark.universe import prices, weights, timeit
+from pyutil.portfolio.portfolio import Portfolio
+
+
+def resident(f):
+    """
+    Memory (in MB) still allocated by the object f returns
+
+    :param f: function without arguments
+    :return: the object and the memory it holds on to
+    """
+    gc.collect()
+    tracemalloc.start()
+    x = f()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return x, current / 2**20
+
+
+def portfolio(dates, assets, dtype):
+    # the frames are built here and dropped on return, the portfolio alone holds on to its memory
+    x = prices(dates=dates, assets=assets)
+    return Portfolio(prices=x, weights=weights(x), dtype=dtype)
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.memory
+    rows = []
+    for dates in [1000, 5000]:
+        for assets in [100, 300]:
+            x = prices(dates=dates, assets=assets)
+            w = weights(x)
+
+            for dtype in [np.float64, np.float32]:
+                p, mb = resident(lambda: portfolio(dates, assets, dtype))
+                # memory the portfolio keeps after computing the nav (the nav itself is dropped)
+                _, mb_nav = resident(lambda: p.nav is None)
+
+                rows.append({"dates": dates, "assets": assets, "dtype": dtype.__name__,
+                             "constructor [s]": timeit(lambda: Portfolio(prices=x, weights=w, dtype=dtype)),
+                             "portfolio [MB]": mb,
+                             "portfolio after nav [MB]": mb + mb_nav})
+
+    print(pd.DataFrame(rows).set_index(["dates", "assets", "dtype"]))
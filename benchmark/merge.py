@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.timeseries.merge import merge
+
+
+def groupby(new, old):
+    # group all entries by their index and sort them
+    x = pd.concat((new, old), sort=True)
+    return x.groupby(x.index).first().sort_index()
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.merge
+    rows = []
+    for n in [1000, 5000, 20000]:
+        x = prices(dates=n, assets=1)["A0000"]
+        old = x.iloc[:-1]
+
+        for case, new in [("append", x.iloc[-1:]), ("overlap", 2 * x.iloc[-20:])]:
+            rows.append({"dates": n, "case": case, "merge [s]": timeit(lambda: merge(new=new, old=old)),
+                         "groupby [s]": timeit(lambda: groupby(new, old))})
+
+    print(pd.DataFrame(rows).set_index(["dates", "case"]))
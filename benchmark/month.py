@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+import calendar
+
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance._month import _monthlytable
+
+
+def groupby(nav):
+    # compound the returns of each month with python functions for the keys and the aggregation
+    r = nav.pct_change().dropna()
+    frame = r.groupby([lambda x: x.year, lambda x: x.month]).apply(lambda x: (1 + x).prod() - 1.0).unstack(level=1)
+    return frame.rename(columns=lambda x: calendar.month_abbr[x])
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.month
+    rows = []
+    for n in [1, 10, 100]:
+        navs = prices(dates=5200, assets=n)
+        rows.append({"columns": n, "panel [s]": timeit(lambda: _monthlytable(navs)),
+                     "loop [s]": timeit(lambda: [_monthlytable(navs[c]) for c in navs.columns]),
+                     "groupby [s]": timeit(lambda: [groupby(navs[c]) for c in navs.columns], repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("columns"))
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance.navarray import NavArray
+from pyutil.performance.summary import fromNav
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.navarray
+    rows = []
+    for years in [1, 10, 30]:
+        x = prices(dates=260 * years, assets=1)["A0000"]
+        stamps, values = x.index.asi8, x.values
+
+        for name, a, b in [("construct", lambda: NavArray(stamps, values), lambda: fromNav(x)),
+                           ("drawdown", lambda: NavArray(stamps, values).drawdown, lambda: fromNav(x).drawdown),
+                           ("summary", lambda: NavArray(stamps, values).summary(), lambda: fromNav(x).summary())]:
+            rows.append({"years": years, "operation": name, "NavArray [s]": timeit(a), "NavSeries [s]": timeit(b)})
+
+    print(pd.DataFrame(rows).set_index(["years", "operation"]))
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance.periods import period_returns, periods
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.periods
+    rows = []
+    for n in [10, 100, 1000]:
+        r = prices(dates=2600, assets=n).pct_change().dropna()
+        p = periods(today=r.index[-1])
+
+        def truncate():
+            # one truncate and product for each period and column
+            return r.apply(lambda x: pd.Series({k: (x.truncate(before=v.start, after=v.end) + 1.0).prod() - 1.0 for k, v in p.items()}))
+
+        rows.append({"columns": n, "period_returns [s]": timeit(lambda: period_returns(r, offset=p)),
+                     "truncate [s]": timeit(truncate, repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("columns"))
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance.summary import fromNav
+
+
+def resample(nav, rule):
+    # the nav at the end of each period, resampled for each series
+    a = pd.concat((nav.head(1), nav.resample(rule).last()), axis=0)
+    a.index = a.index[:-1].append(pd.DatetimeIndex([nav.index[-1]]))
+    return fromNav(a)
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.resample
+    rows = []
+    for n in [10, 100]:
+        navs = [fromNav(x) for _, x in prices(dates=2600, assets=n).items()]
+
+        def calendar():
+            return [(x.monthly, x.annual, x.weekly, x.mtd, x.ytd) for x in navs]
+
+        def each():
+            return [(resample(x, "M"), resample(x, "A"), resample(x, "W"),
+                     resample(x, "M").pct_change().tail(1), resample(x, "A").pct_change().tail(1)) for x in navs]
+
+        rows.append({"columns": n, "calendar [s]": timeit(calendar), "resample [s]": timeit(each, repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("columns"))
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance.summary import fromNav
+
+
+def loop(nav, years=1):
+    # a summary of the truncated nav for each day
+    return [nav.truncate(before=t - pd.DateOffset(years=years), after=t).summary() for t in nav.index[1:]]
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.rolling
+    rows = []
+    for years in [1, 3, 10]:
+        nav = fromNav(prices(dates=260 * years, assets=1)["A0000"])
+        rows.append({"years": years, "rolling_summary [s]": timeit(lambda: nav.rolling_summary(years=1)),
+                     "loop [s]": timeit(lambda: loop(nav), repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("years"))
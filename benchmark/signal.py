@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.timeseries.signal import trend, trends, TrendState
+
+
+def loop(prices, grid):
+    # one call of trend for each asset and parameters
+    return {g + (asset,): trend(prices[asset], *g) for g in grid for asset in prices.keys()}
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.signal
+    grid = [(a, 3 * a, vola, 4.2) for a in (8, 16, 32, 64) for vola in (32, 64)]
+    rows = []
+    for n in [50, 500]:
+        x = prices(dates=2500, assets=n)
+        rows.append({"assets": n, "grid": len(grid), "trends [s]": timeit(lambda: trends(x, grid), repeat=1),
+                     "loop [s]": timeit(lambda: loop(x, grid), repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("assets"))
+
+    # one new price: update the state or recompute the signal over the full history
+    x = prices(dates=5000, assets=1)["A0000"]
+    state = TrendState()
+    for price in x.values[:-1]:
+        state.update(price)
+
+    print(pd.Series({"TrendState.update [s]": timeit(lambda: TrendState.from_series(state.to_series()).update(x.values[-1])),
+                     "trend [s]": timeit(lambda: trend(x).iloc[-1])}))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+import numpy as np
+import pandas as pd
+
+from benchmark.memory import resident
+from benchmark.universe import prices, timeit
+from pyutil.portfolio.portfolio import Portfolio
+
+
+def held(prices, n=80, period=60, seed=2):
+    """
+    Weights of a strategy holding n assets at any time, the selection changes every period dates.
+    Assets never held before are nan, assets sold are zero.
+    """
+    rand = np.random.RandomState(seed)
+    w = np.full(prices.shape, np.nan)
+    for start in range(0, prices.shape[0], period):
+        rows = slice(start, start + period)
+        w[rows][:, ~np.isnan(w[start - 1])] = 0.0 if start > 0 else np.nan
+        w[rows, rand.choice(prices.shape[1], size=n, replace=False)] = 1.0 / n
+
+    return pd.DataFrame(index=prices.index, columns=prices.columns, data=w)
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.sparse
+    x = prices(dates=2500, assets=8000)
+    w = held(x)
+    symbolmap = {a: "S{0}".format(i % 11) for i, a in enumerate(x.columns)}
+
+    rows = []
+    for sparse in [False, True]:
+        portfolio, mb = resident(lambda: Portfolio(prices=x, weights=w.copy(), sparse=sparse))
+        _, mb_nav = resident(lambda: portfolio.nav is None)
+
+        def fresh():
+            return Portfolio(prices=x, weights=w, validate=False, sparse=sparse)
+
+        rows.append({"layout": "sparse" if sparse else "dense",
+                     "portfolio [MB]": mb,
+                     "portfolio after nav [MB]": mb + mb_nav,
+                     # results are cached, hence we time them on a fresh portfolio each time
+                     "constructor [s]": timeit(fresh),
+                     "constructor + nav [s]": timeit(lambda: fresh().nav),
+                     "constructor + leverage [s]": timeit(lambda: fresh().leverage),
+                     "constructor + sector weights [s]": timeit(lambda: fresh().sector_weights(symbolmap=symbolmap)),
+                     "constructor + position [s]": timeit(lambda: fresh().position)})
+
+    print(pd.DataFrame(rows).set_index("layout").transpose())
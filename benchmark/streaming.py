@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+import numpy as np
+import pandas as pd
+
+from benchmark.universe import timeit
+from pyutil.performance.streaming import StreamingNav
+from pyutil.performance.summary import fromNav
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.streaming
+    rows = []
+    for n in [500, 5000, 50000]:
+        rand = np.random.RandomState(0)
+        nav = pd.Series(index=pd.date_range("2018-01-02 09:00", periods=n, freq="min"),
+                        data=np.cumprod(1.0 + 0.001 * rand.standard_normal(n)))
+        def stream():
+            s = StreamingNav()
+            for t, value in nav.items():
+                s.update(t, value)
+            return s
+
+        s = stream()
+        rows.append({"ticks": n, "update [s per tick]": timeit(stream, repeat=1) / n, "summary [s]": timeit(s.summary),
+                     "rebuild + summary [s]": timeit(lambda: fromNav(nav).summary())})
+
+    print(pd.DataFrame(rows).set_index("ticks"))
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance.summary import fromNav, summary_frame
+
+
+def one_by_one(nav, alpha=0.95):
+    # the performance numbers computed one at a time, each going back to the nav
+    periods = nav.periods_per_year
+    return [(1 + nav.returns).prod() - 1.0, nav.sharpe_ratio(periods=periods), nav.annualized_volatility(periods=periods),
+            nav.drawdown.max(), nav.returns.max(), nav.returns.min(), nav.mtd, nav.ytd,
+            nav.calmar_ratio(periods=periods), nav.var(alpha=alpha), nav.cvar(alpha=alpha)]
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.summary
+    rows = []
+    for years in [1, 10, 30]:
+        nav = fromNav(prices(dates=260 * years, assets=1)["A0000"])
+        rows.append({"years": years, "summary [s]": timeit(nav.summary), "one by one [s]": timeit(lambda: one_by_one(nav))})
+
+    print(pd.DataFrame(rows).set_index("years"))
+
+    rows = []
+    for n in [10, 100, 1000]:
+        navs = prices(dates=2600, assets=n)
+        rows.append({"columns": n, "summary_frame [s]": timeit(lambda: summary_frame(navs)),
+                     "loop [s]": timeit(lambda: [fromNav(navs[c]).summary() for c in navs.columns], repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("columns"))
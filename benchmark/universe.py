@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+
+def prices(dates=5000, assets=300, seed=0):
+    """
+    Random walk prices for a universe of assets on business days
+
+    :param dates: number of dates
+    :param assets: number of assets
+    :param seed: seed for the random generator
+    :return: frame of prices
+    """
+    rand = np.random.RandomState(seed)
+    index = pd.bdate_range(start="2000-01-03", periods=dates)
+    columns = ["A{0:04d}".format(i) for i in range(assets)]
+    returns = 0.01 * rand.standard_normal(size=(dates, assets))
+    return pd.DataFrame(index=index, columns=columns, data=100.0 * np.exp(np.cumsum(returns, axis=0)))
+
+
+def weights(prices, seed=1):
+    """
+    Random long-only weights with small daily changes, fully invested
+
+    :param prices: frame of prices
+    :param seed: seed for the random generator
+    :return: frame of weights
+    """
+    rand = np.random.RandomState(seed)
+    w = np.abs(1.0 + 0.01 * rand.standard_normal(size=prices.shape).cumsum(axis=0))
+    return pd.DataFrame(index=prices.index, columns=prices.columns, data=w / w.sum(axis=1, keepdims=True))
+
+
+def timeit(f, repeat=3):
+    """
+    Best wall time of a few runs of f
+
+    :param f: function without arguments
+    :param repeat: number of runs
+    :return: time in seconds
+    """
+    from timeit import default_timer
+
+    best = np.inf
+    for _ in range(repeat):
+        t = default_timer()
+        f()
+        best = min(best, default_timer() - t)
+    return best
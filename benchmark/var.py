@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+import numpy as np
+import pandas as pd
+
+from benchmark.universe import prices, timeit
+from pyutil.performance.summary import value_at_risk
+
+alphas = [0.90, 0.95, 0.99]
+
+
+def sort(navs):
+    # a full sort of the losses for each column and each level
+    rows = {}
+    for column in navs.columns:
+        losses = navs[column].dropna().pct_change().dropna().values * (-1)
+        tails = [np.sort(losses)[int(losses.size * alpha):] for alpha in alphas]
+        rows[column] = [t[0] for t in tails] + [np.sort(losses)[int(losses.size * alpha):].mean() for alpha in alphas]
+    return rows
+
+
+if __name__ == '__main__':
+    pd.options.display.width = 300
+
+    # python -m benchmark.var
+    rows = []
+    for n in [10, 100, 1000]:
+        navs = prices(dates=2600, assets=n)
+        rows.append({"columns": n, "value_at_risk [s]": timeit(lambda: value_at_risk(navs, alphas=alphas)),
+                     "sort [s]": timeit(lambda: sort(navs), repeat=1)})
+
+    print(pd.DataFrame(rows).set_index("columns"))
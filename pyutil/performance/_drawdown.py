@@ -1,19 +1,64 @@
+import numpy as np
 import pandas as pd
 
 
+def _episodes(drawdown, eps=0):
+    """
+    Drawdown episodes of all columns, e.g. the consecutive days a column is in drawdown
+
+    :param drawdown: array of drawdowns (n x columns), nan before and after a column has a value
+    :param eps: a day is down day if the drawdown (positive) is larger than eps
+    :return: arrays with the column, start, trough and end (positions) and the depth of each episode.
+             The end is the first position no longer in drawdown, or the last position of the column
+             if the drawdown didn't recover. The last array is True for recovered episodes.
+    """
+    n, m = drawdown.shape
+
+    # down days of each column, padded with a day not in drawdown on both sides
+    down = np.zeros((m, n + 2), dtype=np.int8)
+    with np.errstate(invalid="ignore"):
+        down[:, 1:-1] = (drawdown > eps).T
+
+    change = np.diff(down, axis=1)
+    column, start = np.nonzero(change == 1)
+    end = np.nonzero(change == -1)[1]
+
+    # recovered if the first day after the episode has a drawdown (e.g. is not behind the last value)
+    recovered = end < n
+    recovered[recovered] = ~np.isnan(drawdown[end[recovered], column[recovered]])
+
+    last = n - 1 - np.argmax(~np.isnan(drawdown[::-1]), axis=0)
+    end = np.where(recovered, end, last[column])
+
+    # all days in drawdown, episode after episode
+    length = np.where(recovered, end, end + 1) - start
+    offset = np.cumsum(length) - length
+    episode = np.repeat(np.arange(start.size), length)
+    pos = np.arange(length.sum()) - offset[episode] + start[episode]
+    values = drawdown[pos, column[episode]]
+
+    depth = np.maximum.reduceat(values, offset) if start.size > 0 else np.zeros(0)
+
+    # the trough is the first day with the deepest drawdown of an episode
+    deepest = values == depth[episode]
+    trough = pos[deepest][np.unique(episode[deepest], return_index=True)[1]]
+
+    return column, start, trough, end, depth, recovered
+
+
 class _Drawdown(object):
-    def __init__(self, series: pd.Series, eps: float = 0) -> object:
+    def __init__(self, series, eps: float = 0) -> object:
         """
-        Drawdown for a given series
-        :param series: pandas Series
+        Drawdown for a given series (or for all columns of a frame)
+        :param series: pandas Series or DataFrame
         :param eps: a day is down day if the drawdown (positive) is larger than eps
         """
         # check series is indeed a series
-        assert isinstance(series, pd.Series)
+        assert isinstance(series, (pd.Series, pd.DataFrame))
         # check that all indices are increasing
         assert series.index.is_monotonic_increasing
         # make sure all entries non-negative
-        assert not (series < 0).any()
+        assert not (series < 0).values.any()
 
         self.__series = series
         self.__eps = eps
@@ -28,33 +73,54 @@ class _Drawdown(object):
 
     @property
     def highwatermark(self):
-        return self.__series.expanding(min_periods=1).max()
+        # running maximum, nans are skipped
+        hwm = np.fmax.accumulate(self.__series.values, axis=0)
+        if isinstance(self.__series, pd.DataFrame):
+            return pd.DataFrame(index=self.__series.index, columns=self.__series.columns, data=hwm)
+        return pd.Series(index=self.__series.index, data=hwm, name=self.__series.name)
 
     @property
     def drawdown(self):
         return 1 - self.__series / self.highwatermark
 
     @property
-    def periods(self):
+    def episodes(self):
+        """
+        Frame with one row for each drawdown episode, indexed by its start (and the column for a frame):
+        the trough, the recovery (NaT if the drawdown didn't recover), the depth and the duration
+        (until the recovery or the last day)
+        """
         d = self.drawdown
+        # days without a value within a series stay in the same state
+        d = d.ffill().where(d.bfill().notnull())
 
-        # the first price can not be in drawdown
-        assert d.iloc[0] == 0
-
-        # Drawdown days
-        is_down = d > self.__eps
+        values = d.values.reshape(len(d.index), -1)
+        column, start, trough, end, depth, recovered = _episodes(values, eps=self.__eps)
 
-        s = pd.Series(index=is_down.index[1:], data=[r for r in zip(is_down[:-1], is_down[1:])])
+        index = self.__series.index
+        if isinstance(self.__series, pd.DataFrame):
+            first = pd.MultiIndex.from_arrays([self.__series.columns[column], index[start]], names=[None, "start"])
+        else:
+            first = pd.Index(index[start], name="start")
 
-        # move from no-drawdown to drawdown
-        start = list(s[s == (False, True)].index)
+        return pd.DataFrame(index=first, data={"trough": index[trough],
+                                               "recovery": pd.Series(index[end]).where(recovered).values,
+                                               "depth": depth,
+                                               "duration": index[end] - index[start]})
 
-        # move from drawdown to drawdown
-        end = list(s[s == (True, False)].index)
-
-        # eventually append the very last day...
-        if len(end) < len(start):
-            # add a point to the series... value doesn't matter
-            end.append(s.index[-1])
+    def top(self, n=5):
+        """
+        The n deepest drawdown episodes (of each column for a frame)
+        """
+        x = self.episodes.sort_values(by="depth", ascending=False, kind="mergesort")
+        if isinstance(self.__series, pd.DataFrame):
+            return x.groupby(level=0, sort=False).head(n).sort_index(level=0, sort_remaining=False, kind="mergesort")
+        return x.head(n)
 
-        return pd.Series({s: e - s for s, e in zip(start, end)})
+    @property
+    def periods(self):
+        # duration of each drawdown episode by its start
+        x = self.episodes["duration"].rename(None)
+        if isinstance(self.__series, pd.DataFrame):
+            return x
+        return x.rename_axis(index=None)
@@ -1,24 +1,47 @@
 import calendar
 import numpy as np
+import pandas as pd
 
 
 def _monthlytable(nav):
     """
-    Get a table of monthly returns
+    Get a table of monthly returns. For a frame of navs a panel, e.g. the tables of all columns on top of each other
 
-    :param nav:
+    :param nav: series (or frame) of navs
 
-    :return:
+    :return: frame of monthly returns (years x months), with the annualized standard deviation and the return of each year
     """
-    r = nav.pct_change().dropna()
+    # no returns for days without a nav, e.g. before and after the nav of a column is available
+    r = nav.pct_change().where(nav.notnull())
+    values = r.values.reshape(len(r.index), -1)
+    valid = ~np.isnan(values)
+
     # Works better in the first month
     # Compute all the intramonth-returns, instead of reapplying some monthly resampling of the NAV
-    return_monthly = r.groupby([lambda x: x.year, lambda x: x.month]).apply(lambda x: (1 + x).prod() - 1.0)
-    frame = return_monthly.unstack(level=1).rename(columns=lambda x: calendar.month_abbr[x])
+    code = 12 * r.index.year.values + r.index.month.values - 1
+    first = np.flatnonzero(np.diff(code, prepend=-1))
+
+    observed = np.add.reduceat(valid, first, axis=0) > 0
+    monthly = np.multiply.reduceat(np.where(valid, values + 1.0, 1.0), first, axis=0) - 1.0
+
+    # one row for each column and year (most recent years on top), one column for each month
+    years, row = np.unique(code[first] // 12, return_inverse=True)
+    table = np.full((values.shape[1], years.size, 12), np.nan)
+    table[:, years.size - 1 - row, code[first] % 12] = np.where(observed, monthly, np.nan).T
+    table = table.reshape(-1, 12)
+
+    # only years and months with returns
+    months = np.flatnonzero(~np.isnan(table).all(axis=0))
+    rows = ~np.isnan(table).all(axis=1)
+
+    if isinstance(nav, pd.DataFrame):
+        index = pd.MultiIndex.from_product([nav.columns, years[::-1]], names=[nav.columns.name, "Year"])
+    else:
+        index = pd.Index(years[::-1], name="Year")
+
+    frame = pd.DataFrame(index=index[rows], columns=[calendar.month_abbr[m + 1] for m in months], data=table[rows][:, months])
     a = (frame + 1.0).prod(axis=1) - 1.0
     frame["STDev"] = np.sqrt(12) * frame.std(axis=1)
     # make sure that you don't include the column for the STDev in your computation
     frame["YTD"] = a
-    frame.index.name = "Year"
-    # most recent years on top
-    return frame.iloc[::-1]
\ No newline at end of file
+    return frame
@@ -0,0 +1,43 @@
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+Calendar = namedtuple("Calendar", ["positions", "labels", "index"])
+
+# calendars by rule and index, least recently used first
+_calendars = OrderedDict()
+_size = 256
+
+
+def _key(index, rule):
+    # two indices share the calendar if they have the same timestamps
+    return rule, str(getattr(index, "tz", None)), len(index), hash(index.asi8.tobytes())
+
+
+def _calendar(index, rule="M"):
+    """
+    Positions of the last entry of each period (e.g. month) in the index and the labels of these periods,
+    the same labels as a resample(rule).last(). Periods without an entry are skipped.
+    The calendar is computed once for each rule and each index (e.g. for all columns of a frame).
+
+    :param index: sorted DatetimeIndex
+    :param rule: resampling rule, e.g. "M", "A" or "W"
+    :return: Calendar of positions and labels, and the index of a resampled series: the first entry of the index,
+             the labels and the last entry of the index instead of the last label
+    """
+    key = _key(index, rule)
+
+    try:
+        _calendars.move_to_end(key)
+        return _calendars[key]
+    except KeyError:
+        last = pd.Series(index=index, data=np.arange(len(index), dtype=float)).resample(rule).last().dropna()
+        labels = last.index
+        c = _calendars[key] = Calendar(positions=last.values.astype(np.int64), labels=labels,
+                                       index=index[:1].append(labels[:-1]).append(index[-1:]).rename(None))
+
+        if len(_calendars) > _size:
+            _calendars.popitem(last=False)
+
+        return c
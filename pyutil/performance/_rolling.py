@@ -0,0 +1,142 @@
+import bisect
+
+import numpy as np
+
+
+def _starts(index, offset):
+    """
+    Position of the first entry of the window ending at each entry, e.g. the first entry not before t - offset
+
+    :param index: sorted DatetimeIndex
+    :param offset: length of the window, e.g. pd.DateOffset(years=1)
+    :return: array of positions
+    """
+    return index.searchsorted(index - offset, side="left")
+
+
+def _moments(r, a, b):
+    """
+    Mean of the returns and of the log-returns and the variance of the returns in the windows r[a:b], from sliding sums
+
+    :param r: array of returns
+    :param a: first return of each window
+    :param b: end (excluded) of each window
+    :return: arrays of mean, mean log-return and variance (ddof=1) for each window
+    """
+    # the sums of the returns around their mean lose less precision
+    shift = np.mean(r) if r.size > 0 else 0.0
+    s1, s2, s3 = (np.concatenate(([0.0], np.cumsum(x))) for x in (r - shift, (r - shift) ** 2, np.log(r + 1.0)))
+
+    n = b - a
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = (s1[b] - s1[a]) / n
+        var = (s2[b] - s2[a] - n * m * m) / (n - 1)
+        return shift + m, (s3[b] - s3[a]) / n, np.maximum(var, 0.0)
+
+
+def _combine(x, y):
+    # max, min and max drawdown of two consecutive blocks of navs
+    return max(x[0], y[0]), min(x[1], y[1]), max(x[2], y[2], 1 - y[1] / x[0])
+
+
+def _drawdown(nav, starts):
+    """
+    Max drawdown and current drawdown in the windows nav[starts[j]:j + 1].
+    The windows are a queue of navs kept in two stacks with the (max, min, max drawdown) of their blocks,
+    each nav is pushed and popped once.
+
+    :param nav: array of navs
+    :param starts: first position of each window, not decreasing
+    :return: arrays of max drawdown and current drawdown
+    """
+    n = nav.size
+    mdd, current = np.zeros(n), np.zeros(n)
+
+    # the front stack holds the aggregates from an entry to the end of the front stack, the oldest entry on top
+    front = []
+    # the back stack holds the aggregate of all its navs
+    back, back_values = None, []
+    head = 0
+
+    for j in range(n):
+        x = nav[j]
+        back = _combine(back, (x, x, 0.0)) if back is not None else (x, x, 0.0)
+        back_values.append(x)
+
+        while head < starts[j]:
+            if not front:
+                # move the navs of the back stack into the front stack
+                agg = None
+                for y in reversed(back_values):
+                    agg = _combine((y, y, 0.0), agg) if agg is not None else (y, y, 0.0)
+                    front.append(agg)
+                back, back_values = None, []
+            front.pop()
+            head += 1
+
+        if front and back is not None:
+            agg = _combine(front[-1], back)
+        else:
+            agg = front[-1] if front else back
+
+        mdd[j] = agg[2]
+        current[j] = 1 - x / agg[0]
+
+    return mdd, current
+
+
+def _tail(r, a, b, alpha):
+    """
+    Value at risk and conditional value at risk of the losses in the windows r[a:b].
+    The losses of the window are kept sorted, each return is inserted and removed once (a binary search
+    and a move of the list in memory). The sum of the tail is updated on each insert and removal and
+    whenever the tail grows or shrinks by one loss, we never sum over the tail of a window.
+
+    :param r: array of returns
+    :param a: first return of each window, not decreasing
+    :param b: end (excluded) of each window, not decreasing
+    :param alpha: confidence level
+    :return: arrays of var and cvar, nan for windows without returns
+    """
+    losses = (r * (-1)).tolist()
+    window = []
+    var, cvar = np.full(a.size, np.nan), np.full(a.size, np.nan)
+
+    # the tail is window[c:] and tail_sum its sum
+    c, tail_sum = 0, 0.0
+
+    first, end = 0, 0
+    for j in range(a.size):
+        while end < b[j]:
+            x = losses[end]
+            i = bisect.bisect_right(window, x)
+            window.insert(i, x)
+            if i >= c:
+                tail_sum += x
+            else:
+                c += 1
+            end += 1
+        while first < a[j]:
+            x = losses[first]
+            i = bisect.bisect_left(window, x)
+            del window[i]
+            if i >= c:
+                tail_sum -= x
+            else:
+                c -= 1
+            first += 1
+
+        # the tail holds the largest n - int(n * alpha) losses
+        k = int(len(window) * alpha)
+        while c > k:
+            c -= 1
+            tail_sum += window[c]
+        while c < k:
+            tail_sum -= window[c]
+            c += 1
+
+        if window:
+            var[j] = window[c]
+            cvar[j] = tail_sum / (len(window) - c)
+
+    return var, cvar
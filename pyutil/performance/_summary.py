@@ -0,0 +1,204 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from ._var import _var, _var_frame
+from pyutil.timeseries.merge import datetime_index
+
+
+class _Summary(object):
+    def __init__(self, series):
+        """
+        Performance numbers for a nav. The returns, log-returns, the running high-water mark
+        and the losses are computed once and all numbers are derived from them.
+
+        :param series: nav series, increasing index without nans
+        """
+        self.__index = series.index
+        self.__nav = np.asarray(series.values, dtype=float)
+
+        # the returns, following a zero for the first nav (where pct_change has a nan)
+        self.__r0 = np.zeros_like(self.__nav)
+        self.__r0[1:] = self.__nav[1:] / self.__nav[:-1] - 1.0
+        self.__r = self.__r0[1:]
+        self.__log = np.log(self.__r + 1.0)
+        self.__hwm = np.maximum.accumulate(self.__nav)
+        self.__losses = self.__r * (-1)
+
+    def __mean_r(self, periods, r_f=0, start=0):
+        # annualized geometric mean of the returns from position start onwards
+        return periods * (np.exp(np.mean(self.__log[start:])) - 1.0) - r_f
+
+    def __volatility(self, periods):
+        # two-pass variance summing over the returns with the leading zero, exactly as pct_change().std()
+        n = self.__r.size
+        sqr = (np.sum(self.__r0) / n - self.__r0) ** 2
+        sqr[0] = 0.0
+        return np.sqrt(periods) * np.sqrt(np.sum(sqr) / (n - 1))
+
+    def __before(self, t):
+        # last nav before t, the first nav if there is none
+        pos = self.__index.searchsorted(t, side="left") - 1
+        return self.__nav[max(pos, 0)]
+
+    def __calmar(self, periods, r_f=0):
+        # drawdown and mean return over the last three years only
+        start = self.__index.searchsorted(self.__index[-1] - pd.DateOffset(years=3), side="left")
+        nav = self.__nav[start:]
+        m = np.max(1 - nav / np.maximum.accumulate(nav))
+        if m == 0:
+            return np.inf
+        return self.__mean_r(periods, r_f=r_f, start=start) / m
+
+    def var(self, alphas):
+        """
+        var and cvar for a list of confidence levels
+        """
+        return _var(self.__losses, alphas)
+
+    def summary(self, alpha=0.95, periods=256, r_f=0):
+        """
+        Performance numbers, same numbers and order as NavSeries.summary
+
+        :param alpha: confidence level for the value at risk
+        :param periods: number of periods per year
+        :param r_f: annualized risk free rate
+        :return: dictionary of performance numbers
+        """
+        today = self.__index[-1]
+        drawdown = 1 - self.__nav / self.__hwm
+        volatility = self.__volatility(periods)
+
+        d = OrderedDict()
+
+        d["Return"] = 100 * (np.prod(self.__r + 1.0) - 1.0)
+        d["# Events"] = self.__r.size
+        d["# Events per year"] = periods
+
+        d["Annua Return"] = 100 * self.__mean_r(periods)
+        d["Annua Volatility"] = 100 * volatility
+        d["Annua Sharpe Ratio (r_f = {0})".format(r_f)] = self.__mean_r(periods, r_f=r_f) / volatility
+
+        d["Max Drawdown"] = 100 * np.max(drawdown)
+        d["Max % return"] = 100 * np.max(self.__r)
+        d["Min % return"] = 100 * np.min(self.__r)
+
+        d["MTD"] = 100 * (self.__nav[-1] / self.__before(today.replace(day=1).normalize()) - 1)
+        d["YTD"] = 100 * (self.__nav[-1] / self.__before(today.replace(month=1, day=1).normalize()) - 1)
+
+        d["Current Nav"] = self.__nav[-1]
+        d["Max Nav"] = self.__hwm[-1]
+        d["Current Drawdown"] = 100 * drawdown[-1]
+
+        d["Calmar Ratio (3Y)"] = self.__calmar(periods, r_f=r_f)
+
+        d["# Positive Events"] = np.count_nonzero(self.__r >= 0)
+        d["# Negative Events"] = np.count_nonzero(self.__r < 0)
+
+        var, cvar = self.var([alpha])
+        d["Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * var[0]
+        d["Conditional Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * cvar[0]
+        d["First at"] = self.__index[0].date()
+        d["Last at"] = today.date()
+
+        return d
+
+
+def _summary_frame(navs, alpha=0.95, periods=None, r_f=0):
+    """
+    Performance numbers for all columns of a frame of navs at once, same numbers as _Summary for each column.
+    The nans of each column are dropped, e.g. columns may start and end at different dates.
+
+    :param navs: frame of navs (dates x columns), increasing index
+    :param alpha: confidence level for the value at risk
+    :param periods: number of periods per year, if not specified we derive it for each column from its dates
+    :param r_f: annualized risk free rate
+    :return: dictionary of performance numbers, an array with one entry per column for each number
+    """
+    # e.g. an index of dates, as for NavSeries
+    index = datetime_index(navs.index)
+
+    values = np.asarray(navs.values, dtype=float)
+    k = np.sum(~np.isnan(values), axis=0)
+    columns = np.arange(values.shape[1])
+    rows = np.arange(values.shape[0])[:, np.newaxis]
+
+    # move the observations of each column to the top, the nans to the bottom
+    order = np.argsort(np.isnan(values), axis=0, kind="stable")
+    nav = np.take_along_axis(values, order, axis=0)
+    stamps = np.where(rows < k, index.asi8[order], np.iinfo(np.int64).max)
+
+    last = np.maximum(k - 1, 0)
+    first_at = pd.DatetimeIndex(index[order[0]]).where(k > 0)
+    last_at = pd.DatetimeIndex(index[order[last, columns]]).where(k > 0)
+
+    if periods is None:
+        # 365 days over the mean distance of the dates
+        with np.errstate(divide="ignore", invalid="ignore"):
+            seconds = (last_at.asi8 - first_at.asi8) / (k - 1) / 1e9
+            periods = np.where(k >= 2, np.round(365 * 24 * 60 * 60 / seconds, decimals=0), 256)
+
+    def before(t):
+        # last nav before the dates t, the first nav if there is none
+        pos = np.maximum(np.sum(stamps < t.asi8, axis=0) - 1, 0)
+        return nav[pos, columns]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = nav[1:] / nav[:-1] - 1.0
+        n = last
+        log = np.log(r + 1.0)
+
+        mean = np.nansum(log, axis=0) / n
+        mean_r = periods * (np.exp(mean) - 1.0)
+        avg = np.nansum(r, axis=0) / n
+        volatility = np.sqrt(periods) * np.sqrt(np.nansum((r - avg) ** 2, axis=0) / (n - 1))
+
+        hwm = np.fmax.accumulate(nav, axis=0)
+        drawdown = 1 - nav / hwm
+
+        # the last three years, the high-water mark starts again
+        start = np.sum(stamps < (last_at - pd.DateOffset(years=3)).asi8, axis=0)
+        tail = np.where(rows >= start, nav, np.nan)
+        m = np.fmax.reduce(1 - tail / np.fmax.accumulate(tail, axis=0), axis=0)
+        mean3 = np.nansum(np.where(rows[1:] > start, log, np.nan), axis=0) / (n - start)
+        calmar = np.where(m == 0, np.inf, (periods * (np.exp(mean3) - 1.0) - r_f) / m)
+
+        var, cvar = _var_frame(r * (-1), [alpha])
+
+        current = nav[last, columns]
+        mtd = current / before(last_at.normalize() - pd.to_timedelta(last_at.day - 1, unit="D")) - 1
+        ytd = current / before(last_at.normalize() - pd.to_timedelta(last_at.dayofyear - 1, unit="D")) - 1
+
+    d = OrderedDict()
+
+    d["Return"] = 100 * (np.nanprod(r + 1.0, axis=0) - 1.0)
+    d["# Events"] = n
+    d["# Events per year"] = periods * np.ones(len(columns))
+
+    d["Annua Return"] = 100 * mean_r
+    d["Annua Volatility"] = 100 * volatility
+    d["Annua Sharpe Ratio (r_f = {0})".format(r_f)] = (mean_r - r_f) / volatility
+
+    d["Max Drawdown"] = 100 * np.fmax.reduce(drawdown, axis=0)
+    d["Max % return"] = 100 * np.fmax.reduce(r, axis=0)
+    d["Min % return"] = 100 * np.fmin.reduce(r, axis=0)
+
+    d["MTD"] = 100 * mtd
+    d["YTD"] = 100 * ytd
+
+    d["Current Nav"] = current
+    d["Max Nav"] = hwm[last, columns]
+    d["Current Drawdown"] = 100 * drawdown[last, columns]
+
+    d["Calmar Ratio (3Y)"] = calmar
+
+    d["# Positive Events"] = np.sum(r >= 0, axis=0)
+    d["# Negative Events"] = np.sum(r < 0, axis=0)
+
+    d["Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * var[0]
+    d["Conditional Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * cvar[0]
+    d["First at"] = first_at.date
+    d["Last at"] = last_at.date
+
+    return d
@@ -1,24 +1,74 @@
 import numpy as np
 
 
+def _var(losses, alphas):
+    """
+    Value at risk and conditional value at risk for a list of confidence levels.
+    Only the largest losses are sorted, all levels share the same partial sort.
+
+    :param losses: array of losses (without nans)
+    :param alphas: confidence levels, e.g. [0.90, 0.95, 0.99]
+    :return: arrays of var and cvar, one entry for each level
+    """
+    k = (np.asarray(alphas) * losses.size).astype(int)
+    first = k.min()
+
+    tail = np.sort(np.partition(losses, first)[first:])
+    return tail[k - first], np.array([tail[i:].mean() for i in k - first])
+
+
+def _losses(navs):
+    """
+    Losses for each column of an array of navs, the nans of each column are dropped first
+
+    :param navs: array of navs (n x columns)
+    :return: array of losses (n - 1 x columns), the nans of a column at its bottom
+    """
+    order = np.argsort(np.isnan(navs), axis=0, kind="stable")
+    nav = np.take_along_axis(navs, order, axis=0)
+    return (nav[1:] / nav[:-1] - 1.0) * (-1)
+
+
+def _var_frame(losses, alphas):
+    """
+    Value at risk and conditional value at risk for a list of confidence levels and each column.
+
+    :param losses: array of losses (n x columns), the nans of a column at its bottom
+    :param alphas: confidence levels, e.g. [0.90, 0.95, 0.99]
+    :return: arrays of var and cvar (levels x columns)
+    """
+    n = np.sum(~np.isnan(losses), axis=0)
+    k = (np.asarray(alphas)[:, np.newaxis] * n).astype(int)
+    first = min(k.min(), losses.shape[0] - 1)
+    columns = np.arange(losses.shape[1])
+
+    # nans are larger than any loss, they stay at the bottom of each column
+    tail = np.sort(np.partition(losses, first, axis=0)[first:], axis=0)
+    rows = np.arange(tail.shape[0])[:, np.newaxis]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = np.array([tail[np.minimum(i - first, tail.shape[0] - 1), columns] for i in k])
+        cvar = np.array([np.nansum(np.where(rows >= i - first, tail, np.nan), axis=0) / (n - i) for i in k])
+
+    return var, cvar
+
+
 class _VaR(object):
     def __init__(self, series, alpha = 0.99):
         self.__series = series.dropna()
         self.__alpha = alpha
+        self.__losses = self.__series.pct_change().dropna().values * (-1)
 
-    @property
-    def __losses(self):
-        return self.__series.pct_change().dropna() * (-1)
-
-    @property
-    def __tail(self):
-        losses = self.__losses
-        return np.sort(losses.values)[int(losses.shape[0] * self.__alpha):]
+    def __call__(self, alphas):
+        """
+        var and cvar for a list of confidence levels at once
+        """
+        return _var(self.__losses, alphas)
 
     @property
     def cvar(self):
-        return self.__tail.mean()
+        return self([self.__alpha])[1][0]
 
     @property
     def var(self):
-        return self.__tail[0]
\ No newline at end of file
+        return self([self.__alpha])[0][0]
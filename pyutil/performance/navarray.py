@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+from ._month import _monthlytable
+from ._summary import _Summary
+from .summary import NavSeries
+from pyutil.timeseries.merge import datetime_index, from_epoch
+
+
+class NavArray(object):
+    # timestamps (int64 nanoseconds since epoch, UTC for a timezone) and navs (float64)
+    __slots__ = ("__stamps", "__values", "__tz")
+
+    def __init__(self, stamps, values, tz=None, validate=True):
+        """
+        Nav backed by two arrays, a light alternative to NavSeries for the analytics
+
+        :param stamps: array of timestamps, nanoseconds since epoch
+        :param values: array of navs
+        :param tz: timezone of the timestamps
+        :param validate: check that the timestamps are increasing and the navs are not negative,
+                         trusted callers may skip this
+        """
+        self.__stamps = np.asarray(stamps, dtype=np.int64)
+        self.__values = np.asarray(values, dtype=np.float64)
+        self.__tz = tz
+
+        if validate:
+            assert self.__stamps.shape == self.__values.shape, "Timestamps and navs have to match"
+            # check that all indices are increasing
+            assert np.all(np.diff(self.__stamps) >= 0)
+            # make sure all entries non-negative
+            assert not np.any(self.__values < 0), "Problem with data:\n{x}".format(x=self.__values[self.__values < 0])
+
+    @staticmethod
+    def from_series(series):
+        """
+        NavArray of a series (e.g. a NavSeries), nans are dropped. The arrays are shared with the series if possible.
+        """
+        if series.hasnans:
+            series = series.dropna()
+
+        index = datetime_index(series.index)
+        return NavArray(stamps=index.asi8, values=series.values, tz=index.tz)
+
+    def to_series(self):
+        """
+        NavSeries of the navs, sharing the arrays with this NavArray
+        """
+        return NavSeries(self.__values, index=self.index, copy=False)
+
+    def __len__(self):
+        return self.__values.size
+
+    def __repr__(self):
+        return "NavArray of {n} navs from {first} to {last}".format(n=len(self), first=self.index[0], last=self.index[-1])
+
+    @property
+    def stamps(self):
+        return self.__stamps
+
+    @property
+    def values(self):
+        return self.__values
+
+    @property
+    def index(self):
+        return from_epoch(self.__stamps, tz=self.__tz)
+
+    @property
+    def empty(self):
+        return self.__values.size == 0
+
+    @property
+    def periods_per_year(self):
+        if len(self) >= 2:
+            return np.round(365 * 24 * 60 * 60 / (np.mean(np.diff(self.__stamps)) / 1e9), decimals=0)
+        else:
+            return 256
+
+    @property
+    def returns(self):
+        """
+        array of returns, the return at position i is earned from i to i + 1
+        """
+        return self.__values[1:] / self.__values[:-1] - 1.0
+
+    @property
+    def highwatermark(self):
+        return np.maximum.accumulate(self.__values)
+
+    @property
+    def drawdown(self):
+        return 1 - self.__values / self.highwatermark
+
+    def truncate(self, before=None, after=None):
+        """
+        NavArray between before and after (both included), sharing the arrays
+        """
+        index = self.index
+        start = index.searchsorted(pd.Timestamp(before), side="left") if before is not None else 0
+        end = index.searchsorted(pd.Timestamp(after), side="right") if after is not None else len(self)
+        return NavArray(stamps=self.__stamps[start:end], values=self.__values[start:end], tz=self.__tz, validate=False)
+
+    def summary(self, alpha=0.95, periods=None, r_f=0):
+        """
+        Performance numbers, the same numbers as NavSeries.summary
+        """
+        periods = periods or self.periods_per_year
+
+        x = pd.Series(_Summary(self).summary(alpha=alpha, periods=periods, r_f=r_f))
+        x.index.name = "Performance number"
+        return x
+
+    @property
+    def monthlytable(self):
+        return _monthlytable(pd.Series(self.__values, index=self.index, copy=False))
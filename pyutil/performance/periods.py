@@ -1,4 +1,6 @@
 from collections import namedtuple
+
+import numpy as np
 import pandas as pd
 
 Period = namedtuple('Period', ['start', 'end'])
@@ -30,27 +32,65 @@ def periods(today=None):
     return offset.apply(__f, today=today)
 
 
-def period_returns(returns, offset=None, today=None):
-    """
-    Compute the returns achieve over certain periods
+class ReturnIndex(object):
+    def __init__(self, returns):
+        """
+        Cumulative log-returns of a series or a frame of returns, built once. The return over any period
+        is then the difference of two entries, e.g. two lookups in the index.
 
-    :param returns: time series of returns
-    :param offset: periods given as a Series, if not specified use standard set of periods
-    :return: Series of periods returns, same order as in the period Series
-    """
+        :param returns: series or frame of returns, nan returns are treated as zero. Columns with a return of -1
+                        or below (e.g. a leveraged or short position) have no log-return and fall back to the
+                        product of the returns
+        """
+        assert isinstance(returns.index[0], pd.Timestamp)
+        self.__index = returns.index
+        self.__columns = returns.columns if isinstance(returns, pd.DataFrame) else None
 
-    def __cumreturn(ts):
-        return (ts + 1.0).prod() - 1.0
+        r = np.asarray(returns.values, dtype=float).reshape(len(returns.index), -1)
+        growth = np.where(np.isnan(r), 1.0, r + 1.0)
 
-    if not isinstance(offset, pd.Series):
-        offset = periods(today=today)
+        # columns without a log-return for some entries
+        self.__lost = np.flatnonzero((growth <= 0).any(axis=0))
+        self.__growth = growth[:, self.__lost]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.log1p(np.where(np.isnan(r), 0.0, r))
+        x[:, self.__lost] = 0.0
+
+        # entry i is the log-return over the first i returns
+        self.__cum = np.zeros((x.shape[0] + 1, x.shape[1]))
+        np.cumsum(x, axis=0, out=self.__cum[1:])
+
+    def period_returns(self, offset):
+        """
+        Returns achieved over the periods, the start and the end of a period are included
 
-    assert isinstance(returns.index[0], pd.Timestamp)
-    p_returns = {key: __cumreturn(returns.truncate(before=period.start, after=period.end)) for key, period in offset.iteritems()}
+        :param offset: periods given as a Series of Period objects
+        :return: Series (or frame of periods x columns) of period returns, same order as in the period Series
+        """
+        lo = self.__index.searchsorted(pd.DatetimeIndex([p.start for p in offset.values]), side="left")
+        hi = np.maximum(self.__index.searchsorted(pd.DatetimeIndex([p.end for p in offset.values]), side="right"), lo)
 
-    # preserve the order of the elements in the offset series
-    return pd.Series(p_returns).loc[offset.index]
+        x = np.expm1(self.__cum[hi] - self.__cum[lo])
 
+        for j, (a, b) in enumerate(zip(lo, hi)):
+            x[j, self.__lost] = np.prod(self.__growth[a:b], axis=0) - 1.0
 
+        if self.__columns is None:
+            return pd.Series(index=offset.index, data=x[:, 0])
 
+        return pd.DataFrame(index=offset.index, columns=self.__columns, data=x)
+
+
+def period_returns(returns, offset=None, today=None):
+    """
+    Compute the returns achieve over certain periods
+
+    :param returns: time series (or frame) of returns
+    :param offset: periods given as a Series, if not specified use standard set of periods
+    :return: Series of periods returns, same order as in the period Series. For a frame of returns a frame (periods x columns)
+    """
+    if not isinstance(offset, pd.Series):
+        offset = periods(today=today)
 
+    return ReturnIndex(returns).period_returns(offset)
@@ -0,0 +1,186 @@
+import heapq
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+class StreamingNav(object):
+    def __init__(self, alpha=0.95, periods=None, r_f=0):
+        """
+        Performance numbers of a nav updated tick by tick, e.g. for intraday monitoring.
+        Each update is O(1), except for the value at risk which keeps the losses in two heaps (O(log n)).
+
+        :param alpha: confidence level for the value at risk
+        :param periods: number of periods per year, if not specified we derive it from the timestamps
+        :param r_f: annualized risk free rate
+        """
+        self.__alpha = alpha
+        self.__periods = periods
+        self.__r_f = r_f
+
+        self.__first = None
+        self.__last = None
+        self.__nav = None
+
+        # number of returns, mean and sum of squared deviations (Welford)
+        self.__n = 0
+        self.__mean = 0.0
+        self.__m2 = 0.0
+
+        self.__log = 0.0
+        self.__prod = 1.0
+        self.__max_r = np.nan
+        self.__min_r = np.nan
+        self.__positive = 0
+        self.__negative = 0
+
+        self.__hwm = np.nan
+        self.__max_drawdown = 0.0
+
+        # last navs before the current month and year
+        self.__month = None
+        self.__year = None
+
+        # the largest losses (min-heap) and all other losses (max-heap, negated)
+        self.__tail = []
+        self.__tail_sum = 0.0
+        self.__body = []
+
+    def update(self, t, nav):
+        """
+        Add a nav
+
+        :param t: timestamp, later than the timestamp of the previous update
+        :param nav: nav at t, not negative
+        :return: self
+        """
+        t = pd.Timestamp(t)
+        assert nav >= 0, "Problem with data: {nav}".format(nav=nav)
+
+        if self.__last is None:
+            self.__first = t
+            self.__month = self.__year = nav
+        else:
+            assert t > self.__last, "Timestamps have to be increasing"
+
+            if (t.year, t.month) != (self.__last.year, self.__last.month):
+                self.__month = self.__nav
+            if t.year != self.__last.year:
+                self.__year = self.__nav
+
+            self.__add(nav / self.__nav - 1.0)
+
+        self.__last = t
+        self.__nav = nav
+
+        self.__hwm = np.fmax(self.__hwm, nav)
+        self.__max_drawdown = max(self.__max_drawdown, self.drawdown)
+        return self
+
+    def __add(self, r):
+        self.__n += 1
+        delta = r - self.__mean
+        self.__mean += delta / self.__n
+        self.__m2 += delta * (r - self.__mean)
+
+        self.__log += np.log(r + 1.0)
+        self.__prod *= r + 1.0
+        self.__max_r = np.fmax(self.__max_r, r)
+        self.__min_r = np.fmin(self.__min_r, r)
+
+        if r >= 0:
+            self.__positive += 1
+        else:
+            self.__negative += 1
+
+        # the tail holds the largest n - int(n * alpha) losses
+        heapq.heappush(self.__body, r)
+        loss = -heapq.heappop(self.__body)
+        heapq.heappush(self.__tail, loss)
+        self.__tail_sum += loss
+
+        while len(self.__tail) > self.__n - int(self.__n * self.__alpha):
+            loss = heapq.heappop(self.__tail)
+            self.__tail_sum -= loss
+            heapq.heappush(self.__body, -loss)
+
+    @property
+    def nav(self):
+        return self.__nav
+
+    @property
+    def events(self):
+        return self.__n
+
+    @property
+    def drawdown(self):
+        return 1 - self.__nav / self.__hwm
+
+    @property
+    def max_drawdown(self):
+        return self.__max_drawdown
+
+    @property
+    def periods_per_year(self):
+        if self.__n >= 1:
+            seconds = (self.__last - self.__first).total_seconds() / self.__n
+            return np.round(365 * 24 * 60 * 60 / seconds, decimals=0)
+        else:
+            return 256
+
+    def summary(self):
+        """
+        Performance numbers, same names and order as in NavSeries.summary. The calmar ratio is only available
+        while all navs are within the last three years.
+        """
+        periods = self.__periods or self.periods_per_year
+        r_f = self.__r_f
+        alpha = self.__alpha
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_r = periods * (np.exp(self.__log / self.__n) - 1.0)
+            volatility = np.sqrt(periods) * np.sqrt(self.__m2 / (self.__n - 1)) if self.__n > 1 else np.nan
+
+        if self.__first < self.__last - pd.DateOffset(years=3):
+            calmar = np.nan
+        elif self.__max_drawdown == 0:
+            calmar = np.inf
+        else:
+            calmar = (mean_r - r_f) / self.__max_drawdown
+
+        d = OrderedDict()
+
+        d["Return"] = 100 * (self.__prod - 1.0)
+        d["# Events"] = self.__n
+        d["# Events per year"] = periods
+
+        d["Annua Return"] = 100 * mean_r
+        d["Annua Volatility"] = 100 * volatility
+        d["Annua Sharpe Ratio (r_f = {0})".format(r_f)] = (mean_r - r_f) / volatility
+
+        d["Max Drawdown"] = 100 * self.__max_drawdown
+        d["Max % return"] = 100 * self.__max_r
+        d["Min % return"] = 100 * self.__min_r
+
+        d["MTD"] = 100 * (self.__nav / self.__month - 1)
+        d["YTD"] = 100 * (self.__nav / self.__year - 1)
+
+        d["Current Nav"] = self.__nav
+        d["Max Nav"] = self.__hwm
+        d["Current Drawdown"] = 100 * self.drawdown
+
+        d["Calmar Ratio (3Y)"] = calmar
+
+        d["# Positive Events"] = self.__positive
+        d["# Negative Events"] = self.__negative
+
+        d["Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * self.__tail[0] if self.__tail else np.nan
+        d["Conditional Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = \
+            100 * self.__tail_sum / len(self.__tail) if self.__tail else np.nan
+        d["First at"] = self.__first.date()
+        d["Last at"] = self.__last.date()
+
+        x = pd.Series(d)
+        x.index.name = "Performance number"
+        return x
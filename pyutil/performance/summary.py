@@ -5,9 +5,13 @@ import pandas as pd
 import numpy as np
 
 from ._month import _monthlytable
+from ._resample import _calendar
+from ._rolling import _starts, _moments, _drawdown, _tail
 from .periods import period_returns
 from ._drawdown import _Drawdown
-from ._var import _VaR
+from ._summary import _Summary, _summary_frame
+from ._var import _VaR, _var_frame, _losses
+from pyutil.timeseries.merge import datetime_index
 
 
 # from addict import Dict
@@ -38,13 +42,106 @@ def performance(nav, alpha=0.95, periods=None):
     return fromNav(nav).summary(alpha=alpha, periods=periods)
 
 
+def summary_frame(navs, alpha=0.95, periods=None, r_f=0):
+    """
+    Performance numbers for all columns of a frame of navs at once, e.g. the same numbers
+    as fromNav(navs[column]).summary() for each column. Columns may start and end at different dates.
+
+    :param navs: frame of navs (dates x columns), nan before and after a nav is available
+    :param alpha: confidence level for the value at risk
+    :param periods: number of periods per year, if not specified we derive it for each column
+    :param r_f: annualized risk free rate
+    :return: frame of performance numbers (numbers x columns)
+    """
+    x = pd.DataFrame(_summary_frame(navs, alpha=alpha, periods=periods, r_f=r_f), index=navs.columns).transpose()
+    x.index.name = "Performance number"
+    return x
+
+
+def monthlytable_frame(navs):
+    """
+    Tables of monthly returns for all columns of a frame of navs at once
+
+    :param navs: frame of navs (dates x columns), nan before and after a nav is available
+    :return: frame of monthly returns indexed by column and year
+    """
+    return _monthlytable(navs)
+
+
+def value_at_risk(navs, alphas=(0.90, 0.95, 0.99)):
+    """
+    Value at risk and conditional value at risk for a few confidence levels at once
+
+    :param navs: nav series or frame of navs (dates x columns), nan before and after a nav is available
+    :param alphas: confidence levels
+    :return: Series of numbers or frame of numbers x columns, same names as in the summary
+    """
+    names = ["Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha)) for alpha in alphas] + \
+            ["Conditional Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha)) for alpha in alphas]
+
+    if isinstance(navs, pd.Series):
+        var, cvar = _VaR(navs)(alphas)
+        return pd.Series(index=names, data=np.concatenate((var, cvar)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var, cvar = _var_frame(_losses(np.asarray(navs.values, dtype=float)), alphas)
+
+    return pd.DataFrame(index=names, columns=navs.columns, data=np.vstack((var, cvar)))
+
+
+def rolling_summary(nav, years=1, alpha=0.95, periods=None, r_f=0, min_events=2):
+    """
+    Performance numbers over a rolling window for each day, e.g. the numbers of
+    nav.truncate(before=t - years).summary() for each day t. Each number is computed in one pass over the nav.
+
+    :param nav: nav series
+    :param years: length of the window in years
+    :param alpha: confidence level for the value at risk
+    :param periods: number of periods per year, if not specified we derive it from the index of the nav
+    :param r_f: annualized risk free rate
+    :param min_events: minimal number of returns in a window, nan for days with shorter windows
+    :return: frame of performance numbers (days x numbers)
+    """
+    nav = fromNav(nav)
+    periods = periods or nav.periods_per_year
+
+    values = nav.values
+    r = values[1:] / values[:-1] - 1.0
+
+    # window of navs starts[j]...j with the returns starts[j]...j-1
+    starts = _starts(nav.index, pd.DateOffset(years=years))
+    ends = np.arange(values.size)
+
+    _, log, variance = _moments(r, starts, ends)
+    mean_r = periods * (np.exp(log) - 1.0)
+    volatility = np.sqrt(periods) * np.sqrt(variance)
+    max_drawdown, drawdown = _drawdown(values, starts)
+    var, cvar = _tail(r, starts, ends, alpha)
+
+    d = OrderedDict()
+    d["# Events"] = ends - starts
+    d["Annua Return"] = 100 * mean_r
+    d["Annua Volatility"] = 100 * volatility
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d["Annua Sharpe Ratio (r_f = {0})".format(r_f)] = (mean_r - r_f) / volatility
+    d["Max Drawdown"] = 100 * max_drawdown
+    d["Current Drawdown"] = 100 * drawdown
+    d["Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * var
+    d["Conditional Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * cvar
+
+    x = pd.DataFrame(d, index=nav.index)
+    x[x["# Events"] < min_events] = np.nan
+    x.columns.name = "Performance number"
+    return x
+
+
 class NavSeries(pd.Series):
     def __init__(self, *args, **kwargs):
         super(NavSeries, self).__init__(*args, **kwargs)
         if not self.empty:
             # change to DateTime
-            if isinstance(self.index[0], date):
-                self.rename(index=lambda x: pd.Timestamp(x), inplace=True)
+            if isinstance(self.index[0], date) and not isinstance(self.index, pd.DatetimeIndex):
+                self.index = datetime_index(self.index)
 
             # check that all indices are increasing
             assert self.index.is_monotonic_increasing
@@ -192,40 +289,8 @@ class NavSeries(pd.Series):
     def summary(self, alpha=0.95, periods=None, r_f=0):
         periods = periods or self.periods_per_year
 
-        d = OrderedDict()
-        # d = Dict()
-
-        d["Return"] = 100 * self.__cum_return
-        d["# Events"] = self.__events
-        d["# Events per year"] = periods
-
-        d["Annua Return"] = 100 * self.__mean_r(periods=periods)
-        d["Annua Volatility"] = 100 * self.annualized_volatility(periods=periods)
-        d["Annua Sharpe Ratio (r_f = {0})".format(r_f)] = self.sharpe_ratio(periods=periods, r_f=r_f)
-
-        dd = self.drawdown
-        d["Max Drawdown"] = 100 * dd.max()
-        d["Max % return"] = 100 * self.returns.max()
-        d["Min % return"] = 100 * self.returns.min()
-
-        d["MTD"] = 100 * self.mtd
-        d["YTD"] = 100 * self.ytd
-
-        d["Current Nav"] = self.tail(1).values[0]
-        d["Max Nav"] = self.max()
-        d["Current Drawdown"] = 100 * dd[dd.index[-1]]
-
-        d["Calmar Ratio (3Y)"] = self.calmar_ratio(periods=periods, r_f=r_f)
-
-        d["# Positive Events"] = self.__positive_events
-        d["# Negative Events"] = self.__negative_events
-
-        d["Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * self.var(alpha=alpha)
-        d["Conditional Value at Risk (alpha = {alpha})".format(alpha=int(100 * alpha))] = 100 * self.cvar(alpha=alpha)
-        d["First at"] = self.index[0].date()
-        d["Last at"] = self.index[-1].date()
-
-        x = pd.Series(d)
+        # all numbers come from one pass over the returns, drawdown and losses
+        x = pd.Series(_Summary(self.dropna()).summary(alpha=alpha, periods=periods, r_f=r_f))
         x.index.name = "Performance number"
         return x
 
@@ -265,10 +330,16 @@ class NavSeries(pd.Series):
     def drawdown_periods(self):
         return _Drawdown(self).periods
 
+    @property
+    def drawdown_episodes(self):
+        return _Drawdown(self).episodes
+
+    def rolling_summary(self, years=1, alpha=0.95, periods=None, r_f=0):
+        return rolling_summary(self, years=years, alpha=alpha, periods=periods, r_f=r_f)
+
     def __res(self, rule="M"):
         # refactor NAV at the end but keep the first element. Important for return computations!
 
-        a = pd.concat((self.head(1), self.resample(rule).last()), axis=0)
-        # overwrite the last index with the trust last index
-        a.index = a.index[:-1].append(pd.DatetimeIndex([self.index[-1]]))
-        return a
+        # the ends of the periods are computed only once for each index, the last index is the true last index
+        c = _calendar(self.index, rule)
+        return pd.Series(index=c.index, data=np.append(self.values[:1], self.values[c.positions]), name=self.name)
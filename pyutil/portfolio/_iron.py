@@ -0,0 +1,104 @@
+import numpy as np
+
+
+def _returns(returns):
+    """
+    Asset returns as a float array, missing returns are treated as zero
+
+    :param returns: array of asset returns (nan for missing data)
+    :return: array of asset returns without nans
+    """
+    r = np.array(returns, dtype=float)
+    r[np.isnan(r)] = 0.0
+    return r
+
+
+def _forward(w, r):
+    """
+    Move the weights w by one period of asset returns r. Assets with nan weights are not in the portfolio.
+
+    :param w: weights of yesterday
+    :param r: asset returns from yesterday to today (no nans)
+    :return: weights of today
+    """
+    # fraction of the cash in the portfolio yesterday
+    cash = 1.0 - np.nansum(w)
+    # new value of each position
+    value = w * (r + 1.0)
+    return value / (np.nansum(value) + cash)
+
+
+def _iron_threshold(weights, returns, threshold=0.02):
+    """
+    Iron weights, e.g. we move the weights forward (without trading) whenever no weight
+    has changed by more than the threshold. The first and the last row are never touched.
+
+    :param weights: array of weights (dates x assets), nan for assets not in the portfolio
+    :param returns: array of asset returns (dates x assets)
+    :param threshold: maximal change in an individual weight we are willing to ignore
+    :return: array of ironed weights
+    """
+    w = np.array(weights, dtype=float)
+    r = _returns(returns)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for today in range(1, w.shape[0] - 1):
+            jump = np.abs(w[today] - w[today - 1])
+            jump = jump[~np.isnan(jump)]
+
+            if jump.size > 0 and jump.max() <= threshold:
+                w[today] = _forward(w[today - 1], r[today])
+
+    return w
+
+
+def _drift(w, returns):
+    """
+    Move the weights w through a block of periods without trading. The value of each position
+    grows with the cumulative product of its returns, the cash stays put.
+
+    :param w: weights at the start of the block
+    :param returns: asset returns (periods x assets, no nans) for the periods in the block
+    :return: weights at the end of each period in the block
+    """
+    # fraction of the cash in the portfolio at the start of the block
+    cash = 1.0 - np.nansum(w)
+    # value of each position relative to the portfolio value at the start of the block
+    value = w * np.cumprod(returns + 1.0, axis=0)
+    return value / (np.nansum(value, axis=1) + cash)[:, np.newaxis]
+
+
+def _moments(index, dates):
+    """
+    Positions of the last entries in index not later than the given dates. The first position is always included.
+
+    :param index: sorted index
+    :param dates: sorted dates, e.g. the labels of a resampling
+    :return: sorted array of unique positions
+    """
+    pos = index.searchsorted(dates, side="right") - 1
+    return np.unique(np.append(0, pos[pos >= 0]))
+
+
+def _iron_time(weights, returns, moments):
+    """
+    Iron weights, e.g. we trade only at the given moments and let the weights drift in between.
+    The last row is never touched.
+
+    :param weights: array of weights (dates x assets), nan for assets not in the portfolio
+    :param returns: array of asset returns (dates x assets)
+    :param moments: sorted positions of the rows we trade
+    :return: array of ironed weights
+    """
+    w = np.array(weights, dtype=float)
+    r = _returns(returns)
+
+    # all blocks end at the next moment or at the last row
+    ends = np.unique(np.append(moments, w.shape[0] - 1))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for start, end in zip(ends[:-1], ends[1:]):
+            if end > start + 1:
+                w[start + 1:end] = _drift(w[start], r[start + 1:end])
+
+    return w
@@ -0,0 +1,55 @@
+import numpy as np
+
+from ._iron import _returns
+
+
+def _asset_returns(prices):
+    """
+    Returns of assets, e.g. the percentage change of the prices along the dates (the second to last axis)
+
+    :param prices: array of prices (... x dates x assets)
+    :return: array of returns, the first date has no return (nan)
+    """
+    r = np.full(prices.shape, np.nan, dtype=prices.dtype)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r[..., 1:, :] = prices[..., 1:, :] / prices[..., :-1, :] - 1.0
+    return r
+
+
+def _weighted_returns(weights, returns):
+    """
+    Returns of the positions. The return of an asset today is earned with the weight of yesterday,
+    no return is earned on the first day and after the last day an asset has a weight (nan)
+
+    :param weights: array of weights (... x dates x assets)
+    :param returns: array of asset returns (dates x assets)
+    :return: array of weighted returns, same shape as the weights
+    """
+    r = _returns(returns)
+
+    x = np.zeros_like(weights)
+    x[..., 1:, :] = np.where(np.isnan(weights[..., :-1, :]), 0.0, weights[..., :-1, :]) * r[1:]
+    x[np.isnan(weights)] = np.nan
+    return x
+
+
+def _portfolio_returns(weights, prices, rows=512):
+    """
+    Return of the portfolio for each date, e.g. the sum of the weighted returns of all assets.
+    The dates are taken in blocks, the asset returns and weighted returns are never held for all dates at once.
+
+    :param weights: array of weights (dates x assets)
+    :param prices: array of prices (dates x assets)
+    :param rows: number of dates in a block
+    :return: array of returns
+    """
+    n = weights.shape[0]
+    x = np.zeros(n, dtype=np.result_type(weights, prices))
+
+    for a in range(0, n, rows):
+        # one more date in front, the returns of a date need the prices and weights of the previous date
+        start, end = max(a - 1, 0), min(a + rows, n)
+        r = _weighted_returns(weights[start:end], _asset_returns(prices[start:end]))
+        x[a:end] = np.nansum(r[a - start:], axis=1)
+
+    return x
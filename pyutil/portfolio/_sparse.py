@@ -0,0 +1,129 @@
+import numpy as np
+
+
+class _SparseWeights(object):
+    # weights by date in compressed sparse rows: the weights of date t are data[indptr[t]:indptr[t+1]]
+    # for the assets indices[indptr[t]:indptr[t+1]]. Only weights different from zero are stored.
+    # Each asset has weights (maybe zero) from its first to its last date, before and after it's not
+    # in the portfolio (nan).
+    __slots__ = ("shape", "indptr", "indices", "data", "first", "last")
+
+    def __init__(self, shape, indptr, indices, data, first, last):
+        self.shape = shape
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.first = first
+        self.last = last
+
+    @staticmethod
+    def from_dense(weights):
+        """
+        Sparse weights from an array of weights (dates x assets)
+
+        :param weights: array of weights, nan for assets not in the portfolio
+        :return: sparse weights
+        """
+        n, m = weights.shape
+        held = ~np.isnan(weights)
+
+        rows, indices = np.nonzero(held & (weights != 0))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        # first and last date with a weight, assets never in the portfolio end before they start
+        first = np.where(held.any(axis=0), np.argmax(held, axis=0), n)
+        last = np.where(held.any(axis=0), n - 1 - np.argmax(held[::-1], axis=0), -1)
+
+        return _SparseWeights(shape=(n, m), indptr=indptr, indices=indices, data=weights[rows, indices],
+                              first=first, last=last)
+
+    @property
+    def rows(self):
+        """
+        date (row) of each stored weight
+        """
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    @property
+    def nnz(self):
+        return self.data.size
+
+    @property
+    def nbytes(self):
+        return sum(x.nbytes for x in (self.indptr, self.indices, self.data, self.first, self.last))
+
+    def __block(self, dtype):
+        # zeros while an asset is in the portfolio, nan before and after
+        t = np.arange(self.shape[0])[:, np.newaxis]
+        return np.where((t >= self.first) & (t <= self.last), 0.0, np.nan).astype(dtype)
+
+    def todense(self):
+        """
+        array of weights (dates x assets)
+        """
+        x = self.__block(self.data.dtype)
+        x[self.rows, self.indices] = self.data
+        return x
+
+    def leverage(self):
+        """
+        sum of weights for each date
+        """
+        return np.bincount(self.rows, weights=self.data, minlength=self.shape[0]).astype(self.data.dtype)
+
+    def returns(self, prices):
+        """
+        Return of the portfolio for each date. The return of an asset today is earned with the weight of yesterday,
+        no return is earned on the first day and after the last day an asset has a weight.
+
+        :param prices: array of prices (dates x assets), only the prices of held assets are used
+        :return: returns for each date
+        """
+        rows, indices = self.rows, self.indices
+
+        # weights of yesterday earning a return today
+        earn = rows + 1 <= self.last[indices]
+        rows, indices, data = rows[earn], indices[earn], self.data[earn]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = prices[rows + 1, indices] / prices[rows, indices] - 1.0
+
+        r[np.isnan(r)] = 0.0
+        x = data * r
+        valid = ~np.isnan(x)
+
+        return np.bincount(rows[valid] + 1, weights=x[valid], minlength=self.shape[0]).astype(self.data.dtype)
+
+    def position(self, nav, prices):
+        """
+        array of positions (dates x assets), e.g. weight times nav over price
+
+        :param nav: nav for each date
+        :param prices: array of prices (dates x assets), only the prices of held assets are used
+        """
+        rows, indices = self.rows, self.indices
+        x = self.__block(self.data.dtype)
+        x[rows, indices] = self.data * nav[rows] / prices[rows, indices]
+        return x
+
+    def aggregate(self, matrix):
+        """
+        Forward filled weights aggregated by a matrix (assets x groups), e.g. weights per sector.
+        An asset keeps its last weight after it left the portfolio.
+
+        :param matrix: array (assets x groups)
+        :return: array (dates x groups)
+        """
+        n = self.shape[0]
+        rows, indices = self.rows, self.indices
+
+        x = np.zeros((n + 1, matrix.shape[1]))
+        np.add.at(x, rows, self.data[:, np.newaxis] * matrix[indices])
+
+        # the last weight of an asset is kept from the day after its last date onwards
+        final = rows == self.last[indices]
+        carry = np.zeros((n + 1, matrix.shape[1]))
+        np.add.at(carry, rows[final] + 1, self.data[final, np.newaxis] * matrix[indices[final]])
+
+        return (x + np.cumsum(carry, axis=0))[:n]
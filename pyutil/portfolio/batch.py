@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+
+from .portfolio import Portfolio
+from ._returns import _asset_returns, _weighted_returns
+
+
+class PortfolioBatch(object):
+    def __init__(self, prices, weights, names=None):
+        """
+        Many portfolios on the same universe of assets, e.g. the portfolios of a parameter sweep.
+        The prices are held once, the weights in one tensor (portfolios x dates x assets).
+
+        :param prices: frame of prices (dates x assets)
+        :param weights: array (portfolios x dates x assets) or list of frames of weights, one frame per portfolio
+        :param names: names of the portfolios, if not specified we number them
+        """
+        if isinstance(weights, np.ndarray):
+            # the batch keeps its own copy, the caller may go on to change the array
+            w = np.array(weights, dtype=np.float64)
+        else:
+            w = np.stack([w.reindex(index=prices.index, columns=prices.columns).values for w in weights]).astype(np.float64, copy=False)
+        assert w.ndim == 3, "Weights have to be given for portfolios x dates x assets"
+        assert w.shape[1:] == prices.shape, "Weights have to match the dates and assets of the prices"
+
+        # avoid duplicates
+        assert not prices.index.has_duplicates, "Price Index has duplicates"
+        assert prices.index.is_monotonic_increasing, "Price Index is not increasing"
+
+        self.__prices = prices.ffill()
+        self.__p = np.asarray(self.__prices.values, dtype=np.float64)
+        self.__w = w
+        self.__names = pd.Index(names) if names is not None else pd.RangeIndex(w.shape[0])
+
+        assert len(self.__names) == w.shape[0], "Number of names and portfolios have to match"
+
+        # the returns of the assets are computed only once for all portfolios
+        self.__r = _asset_returns(self.__p)
+
+    def __repr__(self):
+        return "Batch of {n} portfolios with assets: {assets}".format(n=len(self), assets=list(self.assets))
+
+    def __len__(self):
+        return self.__w.shape[0]
+
+    def __getitem__(self, item):
+        """
+        Portfolio for a position or a name, the portfolio gets a copy of the weights and may be changed
+        (e.g. forward) without changing the batch
+        """
+        i = item if isinstance(self.__names, pd.RangeIndex) else self.__names.get_loc(item)
+        weights = pd.DataFrame(index=self.index, columns=self.__prices.columns, data=self.__w[i].copy())
+        return Portfolio(prices=self.__prices, weights=weights, validate=False)
+
+    def __frame(self, data):
+        return pd.DataFrame(index=self.index, columns=self.__names, data=data)
+
+    @property
+    def names(self):
+        """
+        names of the portfolios
+        """
+        return self.__names
+
+    @property
+    def index(self):
+        """
+        index of the portfolios (e.g. timestamps)
+        """
+        return self.__prices.index
+
+    @property
+    def assets(self):
+        """
+        list of assets
+        """
+        return sorted(self.__prices.columns)
+
+    @property
+    def prices(self):
+        """
+        frame of prices
+        """
+        return self.__prices
+
+    @property
+    def weights(self):
+        """
+        tensor of weights (portfolios x dates x assets)
+        """
+        return self.__w
+
+    @property
+    def returns(self):
+        """
+        frame of returns (dates x portfolios)
+        """
+        return self.__frame(np.nansum(_weighted_returns(self.__w, self.__r), axis=2).T)
+
+    @property
+    def nav(self):
+        """
+        frame of navs (dates x portfolios), each nav starts at 1
+        """
+        return (self.returns + 1.0).cumprod()
+
+    @property
+    def leverage(self):
+        """
+        frame of leverage (dates x portfolios)
+        """
+        return self.__frame(np.nansum(self.__w, axis=2).T)
+
+    @property
+    def cash(self):
+        """
+        frame of cash (dates x portfolios)
+        """
+        return 1.0 - self.leverage
+
+    def summary(self, periods=None, r_f=0):
+        """
+        Performance numbers for all portfolios
+
+        :param periods: number of periods per year, if not specified we derive it from the index
+        :param r_f: annualized risk free rate
+        :return: frame of performance numbers (numbers x portfolios)
+        """
+        if periods is None:
+            periods = np.round(365 * 24 * 60 * 60 / pd.Series(data=self.index).diff().mean().total_seconds(), decimals=0)
+
+        nav = self.nav.values
+        r = nav[1:] / nav[:-1] - 1.0
+        drawdown = 1.0 - nav / np.maximum.accumulate(nav, axis=0)
+
+        mean_r = periods * (np.exp(np.mean(np.log(r + 1.0), axis=0)) - 1.0)
+        volatility = np.sqrt(periods) * np.std(r, axis=0, ddof=1)
+
+        d = dict()
+        d["Return"] = 100 * (np.prod(r + 1.0, axis=0) - 1.0)
+        d["# Events"] = r.shape[0]
+        d["# Events per year"] = periods
+        d["Annua Return"] = 100 * mean_r
+        d["Annua Volatility"] = 100 * volatility
+        d["Annua Sharpe Ratio (r_f = {0})".format(r_f)] = (mean_r - r_f) / volatility
+        d["Max Drawdown"] = 100 * np.max(drawdown, axis=0)
+        d["Current Nav"] = nav[-1]
+        d["Max Nav"] = np.max(nav, axis=0)
+        d["Current Drawdown"] = 100 * drawdown[-1]
+
+        x = pd.DataFrame(d, index=self.__names).transpose()
+        x.index.name = "Performance number"
+        return x
@@ -1,9 +1,17 @@
 import os
+from collections import namedtuple
 
+import numpy as np
 import pandas as pd
 
-from ..performance.summary import fromReturns
+from ..performance.summary import fromNav
 from ..performance.periods import period_returns, periods
+from ._iron import _iron_threshold, _iron_time, _moments, _drift, _forward, _returns
+from ._returns import _asset_returns, _weighted_returns, _portfolio_returns
+from ._sparse import _SparseWeights
+from .sector import Sectors
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "currsize"])
 
 
 def merge(portfolios, axis=0):
@@ -29,8 +37,14 @@ def similar(a, b, eps=1e-6):
 
 
 class Portfolio(object):
+    # prices and weights live in two arrays (dates x assets) owned by the portfolio and sharing one index and
+    # one set of asset names, the frames are only built on demand and are read-only views on those arrays
+    __slots__ = ("__index", "__assets", "__columns", "__held", "__p", "__w", "__r",
+                 "__cache", "__hits", "__misses", "__buffers", "__s")
+
     def copy(self):
-        return Portfolio(prices=self.prices.copy(), weights=self.weights.copy())
+        return Portfolio(prices=self.prices.copy(), weights=self.__weights_frame.copy(),
+                         dtype=self.__p.dtype, validate=False, sparse=self.sparse)
 
     def iron_threshold(self, threshold=0.02):
         """
@@ -39,95 +53,302 @@ class Portfolio(object):
         :param threshold:
         :return:
         """
-        portfolio = self.copy()
-        for yesterday, today in zip(self.index[:-2], self.index[1:-1]):
-            if (portfolio.weights.loc[today] - portfolio.weights.loc[yesterday]).abs().max() <= threshold:
-                portfolio.forward(today, yesterday=yesterday)
-
-        return portfolio
+        w = _iron_threshold(weights=self.__dense, returns=self.__asset_returns, threshold=threshold)
+        return Portfolio(prices=self.prices, weights=self.__weights_of(w),
+                         dtype=self.__p.dtype, validate=False, sparse=self.sparse)
 
     def iron_time(self, rule):
-        # make sure the order is correct...
-        portfolio = self.copy()
-
-        moments = [self.index[0]]
-
-        # we need timestamps from the underlying series not the end of the intervals!
-        resample = self.weights.resample(rule=rule).last()
-        for t in resample.index:
-            moments.append([a for a in self.index if a <= t][-1])
+        """
+        Iron a portfolio, trade only at the last date within each period and let the weights drift in between.
+        Do not touch the last index.
 
-        # run through all dates expect the last one...
-        for date in self.weights.index[:-1]:
-            # if that's not a special date, forward the portfolio
-            if date not in moments:
-                portfolio.forward(date)
+        :param rule: offset alias for the resampling (e.g. "M", "W") or a sorted list of rebalancing dates
+        :return:
+        """
+        if isinstance(rule, str):
+            # we need timestamps from the underlying series not the end of the intervals!
+            rule = pd.Series(index=self.index, dtype=float).resample(rule=rule).last().index
 
-        return portfolio
+        w = _iron_time(weights=self.__dense, returns=self.__asset_returns, moments=_moments(self.index, rule))
+        return Portfolio(prices=self.prices, weights=self.__weights_of(w),
+                         dtype=self.__p.dtype, validate=False, sparse=self.sparse)
 
     def forward(self, t, yesterday=None):
         # We move weights to t
-        yesterday = yesterday or self.__before[t]
+        self.__densify()
+        today = self.__index.get_loc(t)
+        yesterday = self.__index.get_loc(yesterday) if yesterday is not None else today - 1
+        assert yesterday >= 0, "There is no date before {t}".format(t=t)
 
-        # weights of "yesterday"
-        w1 = self.__weights.loc[yesterday].dropna()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.__w[today] = _forward(self.__w[yesterday], _returns(self.__asset_returns[today]))
 
-        # fraction of the cash in the portfolio yesterday
-        cash = 1 - w1.sum()
+        self.__changed()
+        return self
 
-        # new value of each position
-        value = w1 * (self.asset_returns.loc[t].fillna(0.0) + 1)
+    def forward_range(self, start, end=None):
+        """
+        Move the weights forward for all dates between start and end (both included), e.g. we do not trade.
+        Same as calling forward for each of those dates but all dates are computed in one go.
+
+        :param start: first date we overwrite, the weights of the previous date are moved forward
+        :param end: last date we overwrite, if not specified we move through to the last date
+        :return: the portfolio
+        """
+        a = self.index.searchsorted(start, side="left")
+        b = self.index.searchsorted(end, side="right") if end is not None else len(self.index)
+        assert a >= 1, "There is no date before {start}".format(start=start)
 
-        # compute the new weights...
-        self.weights.loc[t] = value / (value.sum() + cash)
+        self.__densify()
+        if b > a:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self.__w[a:b] = _drift(self.__w[a - 1], _returns(self.__asset_returns[a:b]))
 
+        self.__changed()
         return self
 
-    def __init__(self, prices, weights=None):
-        # if you don't specify any weights, we initialize them with nan
+    def __init__(self, prices, weights=None, dtype=np.float64, validate=True, sparse=False):
+        """
+        Portfolio described by prices and weights (dates x assets)
+
+        :param prices: frame of prices
+        :param weights: frame of weights or series with one weight per asset, if not specified all weights are zero
+        :param dtype: float type of the arrays holding prices and weights, e.g. np.float32 to save memory
+        :param validate: check the indices and the weights and fill the prices. Only skip this for prices and weights
+                         taken from an existing portfolio
+        :param sparse: keep only the weights different from zero (by date), e.g. for a large universe of assets
+                       with few assets held at any time
+        """
+        # frames built here are not copied again, the arrays of all others are still owned by the caller
+        own_p, own_w = False, False
+
+        # if you don't specify any weights, we initialize them with zeros
         if weights is None:
-            weights = pd.DataFrame(index=prices.index, columns=prices.keys(), data=0.0)
+            weights, own_w = pd.DataFrame(index=prices.index, columns=prices.keys(), data=0.0), True
 
         # If weights is a Series, each weight per asset!
         if isinstance(weights, pd.Series):
-            w = pd.DataFrame(index=prices.index, columns=weights.keys())
-            for t in w.index:
-                w.loc[t] = weights
+            weights = pd.DataFrame(index=prices.index, columns=weights.keys(),
+                                   data=np.tile(weights.values, (len(prices.index), 1)))
+            own_w = True
+
+        if validate:
+            # make sure the keys are matching
+            assert set(weights.keys()) <= set(prices.keys()), "Key for weights not subset of keys for prices"
+            # enforce some indixes
+            assert prices.index.equals(weights.index), "Index for prices and weights have to match"
+
+            # avoid duplicates
+            assert not prices.index.has_duplicates, "Price Index has duplicates"
+            assert not weights.index.has_duplicates, "Weights Index has duplicates"
+
+            assert prices.index.is_monotonic_increasing, "Price Index is not increasing"
+            assert weights.index.is_monotonic_increasing, "Weight Index is not increasing"
+
+            # each asset has weights on one block of consecutive dates, e.g. we count the starts of such blocks
+            held = weights.notnull().values.astype(bool)
+            blocks = held[:1].sum(axis=0) + (held[1:] & ~held[:-1]).sum(axis=0)
+            gaps = list(weights.columns[blocks > 1])
+            assert not gaps, "There are gaps in the weights for {0}".format(gaps)
+
+            if prices.isnull().values.any():
+                prices, own_p = prices.ffill(), True
+
+        self.__index = prices.index
+        self.__assets = prices.columns
+        self.__weight_columns(weights.columns)
+
+        # assets without weights are not in the portfolio
+        if self.__held is not None:
+            weights, own_w = weights.reindex(columns=prices.columns), True
+
+        # we copy the arrays of the caller, an edit of its frames would not be seen by the cached results
+        self.__p = np.array(prices.values, dtype=dtype, copy=not own_p)
+        self.__w = np.array(weights.values, dtype=dtype, copy=not own_w)
+        self.__s = None
+
+        if sparse:
+            self.__s = _SparseWeights.from_dense(self.__w)
+            self.__w = None
+
+        # asset returns are computed on demand
+        self.__r = None
+
+        # derived results (nav, leverage, ...) are kept until the weights change
+        self.__cache = dict()
+        self.__hits = 0
+        self.__misses = 0
+
+        # arrays with spare rows for appending dates, only allocated once we append
+        self.__buffers = dict()
+
+    def __weight_columns(self, columns):
+        # the weights frame has only the assets given weights (in their order), held are their positions
+        self.__columns = columns
+        self.__held = None if columns.equals(self.__assets) else self.__assets.get_indexer(columns)
+
+    def __changed(self):
+        # the weights only change through the setter, forward, forward_range and append
+        self.__cache.clear()
+
+    def __cached(self, key, f):
+        try:
+            x = self.__cache[key]
+            self.__hits += 1
+        except KeyError:
+            x = self.__cache[key] = f()
+            self.__misses += 1
+        return x
+
+    @property
+    def cache_info(self):
+        """
+        hits and misses of the cache for derived results and the number of results in the cache
+        :return:
+        """
+        return CacheInfo(hits=self.__hits, misses=self.__misses, currsize=len(self.__cache))
+
+    def __frame(self, data, columns=None):
+        columns = self.__assets if columns is None else columns
+        return pd.DataFrame(index=self.__index, columns=columns, data=data, copy=False)
+
+    def __view(self, data, columns=None):
+        # read-only frame on an array of the portfolio, writing into it raises a ValueError.
+        # A new frame each time, a column assigned to one frame is never seen by the next
+        view = data.view()
+        view.flags.writeable = False
+        return self.__frame(view, columns=columns)
+
+    def __weights_of(self, w):
+        # frame of weights (dates x assets) restricted to the assets given weights
+        if self.__held is None:
+            return self.__frame(w)
+        return self.__frame(w[:, self.__held], columns=self.__columns)
+
+    @property
+    def __asset_returns(self):
+        if self.__r is None:
+            self.__r = _asset_returns(self.__p)
+
+        return self.__r
+
+    @property
+    def __nav(self):
+        # only the nav is kept, not the weighted returns behind it
+        def f():
+            if self.__s is not None:
+                return np.cumprod(self.__s.returns(self.__p) + 1.0)
+            return np.cumprod(_portfolio_returns(self.__w, self.__p) + 1.0)
+
+        return self.__cached("nav", f)
+
+    @property
+    def __leverage(self):
+        def f():
+            if self.__s is not None:
+                return self.__s.leverage()
+            return np.nansum(self.__w, axis=1)
+
+        return self.__cached("leverage", f)
 
-            weights = w
+    @property
+    def __dense(self):
+        # dense array of weights, for a sparse portfolio that's a temporary copy
+        if self.__s is not None:
+            return self.__s.todense()
+        return self.__w
+
+    def __densify(self):
+        # we are about to change the weights, a sparse portfolio turns dense for good
+        if self.__s is not None:
+            self.__w = self.__s.todense()
+            self.__s = None
+
+    @property
+    def sparse(self):
+        """
+        true only if the weights are kept in sparse form
+        :return:
+        """
+        return self.__s is not None
+
+    def __append(self, name, x, row):
+        # write the row after the last row of x, the buffer doubles its rows whenever it is full
+        n = x.shape[0]
+        buffer = self.__buffers.get(name)
+
+        # x has to be the leading rows of our buffer, otherwise (e.g. a result computed again) we start a new one
+        if buffer is None or x.base is not buffer or buffer.shape[0] == n:
+            buffer = np.empty((max(2 * n, 16),) + x.shape[1:], dtype=x.dtype)
+            buffer[:n] = x
+            self.__buffers[name] = buffer
+
+        buffer[n] = row
+        return buffer[:n + 1]
+
+    def append(self, date, prices, weights):
+        """
+        Append a date to the portfolio, e.g. for the daily update. Only the new row of returns, weighted returns,
+        nav, leverage and position is computed, the results are the same as for the rebuilt portfolio.
+
+        :param date: the new date, has to be later than the last date of the portfolio
+        :param prices: series of prices, missing prices are filled with the last known price
+        :param weights: series of weights, assets without a weight are not in the portfolio
+        :return: the portfolio
+        """
+        assert not self.empty, "Can not append to an empty portfolio"
+        self.__densify()
+
+        if isinstance(self.__index, pd.DatetimeIndex):
+            date = pd.Timestamp(date)
+
+        assert date > self.__index[-1], "The date {date} is not after the last date of the portfolio".format(date=date)
+
+        p = np.asarray(prices.reindex(self.__assets).values, dtype=self.__p.dtype)
+        p = np.where(np.isnan(p), self.__p[-1], p)
+
+        w = np.asarray(weights.reindex(self.__assets).values, dtype=self.__w.dtype)
 
-        # make sure the keys are matching
-        assert set(weights.keys()) <= set(prices.keys()), "Key for weights not subset of keys for prices"
-        # enforce some indixes
-        assert prices.index.equals(weights.index), "Index for prices and weights have to match"
+        # assets coming back into the portfolio would leave a gap in their weights
+        back = ~np.isnan(w) & np.isnan(self.__w[-1])
+        if back.any():
+            gaps = list(self.__assets[back][~np.isnan(self.__w[:, back]).all(axis=0)])
+            assert not gaps, "There are gaps in the weights for {0}".format(gaps)
 
-        # avoid duplicates
-        assert not prices.index.has_duplicates, "Price Index has duplicates"
-        assert not weights.index.has_duplicates, "Weights Index has duplicates"
+        # assets given their first weight join the weights frame
+        if self.__held is not None:
+            new = np.setdiff1d(np.flatnonzero(~np.isnan(w)), self.__held)
+            if new.size > 0:
+                self.__weight_columns(self.__columns.append(self.__assets[new]))
 
-        assert prices.index.is_monotonic_increasing, "Price Index is not increasing"
-        assert weights.index.is_monotonic_increasing, "Weight Index is not increasing"
+        self.__index = self.__index.append(pd.Index([date]))
+        self.__p = self.__append("p", self.__p, p)
+        self.__w = self.__append("w", self.__w, w)
 
-        self.__prices = prices.ffill()
+        if self.__r is not None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self.__r = self.__append("r", self.__r, p / self.__p[-2] - 1.0)
 
-        for key, w in weights.items():
-            # check the weight series...
-            series = w.copy()
-            series.index = range(0, len(series))
-            # remove all nans
-            series = series.dropna()
+        # extend the derived results we know already
+        cache = self.__cache
+        self.__cache = dict()
 
-            # compute the length of the maximal gap
-            max_gap = pd.Series(data=series.index).diff().dropna().max()
-            assert not max_gap > 1, "There are gaps in the series {0} and gap {1}".format(w, max_gap)
+        if "nav" in cache:
+            x = _portfolio_returns(self.__w[-2:], self.__p[-2:])[-1]
+            nav = self.__cache["nav"] = self.__append("nav", cache["nav"], cache["nav"][-1] * (x + 1.0))
 
-        self.__weights = weights
+            if "trading_days" in cache:
+                position = self.__w[-2:] * nav[-2:, np.newaxis] / self.__p[-2:]
+                days = np.nansum(np.abs(np.diff(1e6 * position, axis=0)))
+                self.__cache["trading_days"] = cache["trading_days"] + ([self.__index[-1]] if days > 1 else [])
 
-        self.__before = {today : yesterday for today, yesterday in zip(prices.index[1:], prices.index[:-1])}
-        self.__r = self.__prices.pct_change()
+        if "leverage" in cache:
+            self.__cache["leverage"] = self.__append("leverage", cache["leverage"], np.nansum(w))
+
+        return self
 
     def __repr__(self):
-        return "Portfolio with assets: {0}".format(list(self.__weights.keys()))
+        return "Portfolio with assets: {0}".format(list(self.__assets))
 
     @property
     def cash(self):
@@ -143,31 +364,49 @@ class Portfolio(object):
         list of assets
         :return:
         """
-        return list(self.__prices.sort_index(axis=1).columns)
+        return sorted(self.__assets)
 
     @property
     def prices(self):
         """
-        frame of prices
+        frame of prices, read-only
         :return:
         """
-        return self.__prices
+        return self.__view(self.__p)
+
+    @property
+    def __weights_frame(self):
+        w = self.__dense
+        if self.__held is not None:
+            w = w[:, self.__held]
+        return self.__view(w, columns=self.__columns)
 
     @property
     def weights(self):
         """
-        frame of weights
+        frame of weights for the assets given weights, read-only. Change the weights with the setter,
+        forward or forward_range
         :return:
         """
-        return self.__weights
+        return self.__weights_frame
+
+    @weights.setter
+    def weights(self, weights):
+        assert weights.index.equals(self.__index), "Index for weights has to match the index of the portfolio"
+        assert set(weights.keys()) <= set(self.__assets), "Key for weights not subset of assets"
+
+        self.__densify()
+        self.__w[:] = weights.reindex(columns=self.__assets).values
+        self.__weight_columns(weights.columns)
+        self.__changed()
 
     @property
     def asset_returns(self):
         """
-        frame of returns
+        frame of returns, read-only
         :return:
         """
-        return self.__r
+        return self.__view(self.__asset_returns)
 
     @property
     def nav(self):
@@ -175,7 +414,7 @@ class Portfolio(object):
         nav series
         :return:
         """
-        return fromReturns(self.weighted_returns.sum(axis=1))
+        return self.__cached("nav_series", lambda: fromNav(pd.Series(index=self.__index, data=self.__nav)))
 
     @property
     def weighted_returns(self):
@@ -183,8 +422,8 @@ class Portfolio(object):
         frame of returns after weights
         :return:
         """
-        r = self.asset_returns.fillna(0.0)
-        return pd.DataFrame({a: r[a]*self.weights[a].dropna().shift(1).fillna(0.0) for a in self.assets})
+        r = _weighted_returns(self.__dense, self.__asset_returns)
+        return self.__frame(r)[self.assets]
 
     @property
     def index(self):
@@ -192,7 +431,7 @@ class Portfolio(object):
         index of the portfolio (e.g. timestamps)
         :return:
         """
-        return self.prices.index
+        return self.__index
 
     @property
     def leverage(self):
@@ -200,7 +439,7 @@ class Portfolio(object):
         leverage (sum of weights)
         :return:
         """
-        return self.weights.sum(axis=1).dropna().apply(float)
+        return pd.Series(index=self.__index, data=self.__leverage)
 
     def truncate(self, before=None, after=None):
         """
@@ -210,7 +449,8 @@ class Portfolio(object):
         :return:
         """
         return Portfolio(prices=self.prices.truncate(before=before, after=after),
-                    weights=self.weights.truncate(before=before, after=after))
+                         weights=self.__weights_frame.truncate(before=before, after=after),
+                         dtype=self.__p.dtype, validate=False, sparse=self.sparse)
 
     @property
     def empty(self):
@@ -226,19 +466,36 @@ class Portfolio(object):
         current weight, e.g. the last weight
         :return:
         """
-        w = self.weights.ffill()
+        w = self.__weights_frame.ffill()
         a = w.loc[w.index[-1]]
         a.index.name = "weight"
         return a
 
+    def group_weights(self, sectors):
+        """
+        weights per group for all groupings of sectors at once, assets keep their last weight
+        :param sectors: Sectors object
+        :return: frame of weights (dates x (grouping, group))
+        """
+        if self.__s is not None:
+            matrix = sectors.matrix.reindex(index=self.__assets, fill_value=0.0)
+            return pd.DataFrame(index=self.__index, columns=matrix.columns, data=self.__s.aggregate(matrix.values))
+
+        return sectors.aggregate(self.__weights_frame.ffill())
+
     def sector_weights(self, symbolmap, total=False):
         """
-        weights per sector, symbolmap is a dictionary
+        weights per sector, symbolmap is a dictionary or a Sectors object with one grouping
         :param symbolmap:
         :param total:
         :return:
         """
-        frame = self.weights.ffill().groupby(by=symbolmap, axis=1).sum()
+        sectors = symbolmap if isinstance(symbolmap, Sectors) else Sectors(assets=self.__assets, sector=symbolmap)
+        assert len(sectors.groupings) == 1, "Sector weights need exactly one grouping"
+
+        frame = self.group_weights(sectors)
+        frame.columns = frame.columns.droplevel(0)
+
         if total:
             frame["Total"] = frame.sum(axis=1)
         return frame
@@ -255,48 +512,61 @@ class Portfolio(object):
         today = self.index[-1]
         offsets = periods(today)
 
-        a = self.weighted_returns.apply(period_returns, offset=offsets).transpose()[
-            ["Month-to-Date", "Year-to-Date"]]
+        a = period_returns(self.weighted_returns, offset=offsets).transpose()[["Month-to-Date", "Year-to-Date"]]
         t = self.trading_days[-n:]
 
-        b = self.weights.ffill().loc[t].rename(index=lambda x: x.strftime("%d-%b-%y")).transpose()
+        b = self.__weights_frame.ffill().loc[t].rename(index=lambda x: x.strftime("%d-%b-%y")).transpose()
         return pd.concat((a, b), axis=1)
 
     def top_flop_ytd(self, n=5, day_final=pd.Timestamp("today")):
         return self.__f(n=n, day_final=day_final, term="Year-to-Date")
 
     def __f(self, n=5, term="Month-to-Date", day_final=pd.Timestamp("today")):
-        s = self.weighted_returns.apply(period_returns, offset=periods(today=day_final)).transpose()[term]
+        s = period_returns(self.weighted_returns, offset=periods(today=day_final)).loc[term]
         return {"top": s.sort_values(ascending=False).head(n), "flop": s.sort_values(ascending=True).head(n)}
 
     def top_flop_mtd(self, n=5, day_final=pd.Timestamp("today")):
         return self.__f(n=n, day_final=day_final, term="Month-to-Date")
 
     def tail(self, n=10):
-        w = self.weights.tail(n)
-        return Portfolio(prices=self.prices.loc[w.index], weights=w)
+        w = self.__weights_frame.tail(n)
+        return Portfolio(prices=self.prices.loc[w.index], weights=w,
+                         dtype=self.__p.dtype, validate=False, sparse=self.sparse)
 
     @property
     def position(self):
-        return pd.DataFrame({k: self.weights[k] * self.nav / self.prices[k] for k in self.assets})
+        return self.__frame(self.__position)[self.assets]
+
+    @property
+    def __position(self):
+        # not kept, the position is as large as the weights
+        if self.__s is not None:
+            return self.__s.position(self.__nav, self.__p)
+        return self.__w * self.__nav[:, np.newaxis] / self.__p
 
     def subportfolio(self, assets):
-        return Portfolio(prices=self.prices[assets], weights=self.weights[assets])
+        return Portfolio(prices=self.prices[assets], weights=self.__weights_frame[assets],
+                         dtype=self.__p.dtype, validate=False, sparse=self.sparse)
 
     def __mul__(self, other):
-        return Portfolio(prices=self.prices, weights=other * self.weights)
+        return Portfolio(prices=self.prices, weights=other * self.__weights_frame,
+                         dtype=self.__p.dtype, validate=False, sparse=self.sparse)
 
     def __rmul__(self, other):
         return self.__mul__(other)
 
     def apply(self, function, axis=0):
-        return Portfolio(prices=self.prices, weights=self.weights.apply(function, axis=axis))
+        return Portfolio(prices=self.prices, weights=self.__weights_frame.apply(function, axis=axis))
 
     @property
     def trading_days(self):
-        __fundsize = 1e6
-        days = (__fundsize * self.position).diff().abs().sum(axis=1)
-        return sorted(list(days[days > 1].index))
+        def f():
+            __fundsize = 1e6
+            days = np.nansum(np.abs(np.diff(__fundsize * self.__position, axis=0)), axis=1)
+            return sorted(list(self.__index[1:][days > 1]))
+
+        # hand out a copy, the list may be changed by the caller
+        return list(self.__cached("trading_days", f))
 
     @property
     def state(self):
@@ -307,15 +577,15 @@ class Portfolio(object):
             trade_events.append(today)
 
         # extract the weights at all those trade events
-        weights = self.weights.ffill().loc[trade_events].transpose()
+        weights = self.__weights_frame.ffill().loc[trade_events].transpose()
 
         # that's the portfolio where today has been forwarded to (from yesterday),
-        p = Portfolio(prices=self.prices, weights=self.weights.copy()).forward(today)
+        p = Portfolio(prices=self.prices, weights=self.__weights_frame.copy()).forward_range(today)
 
         weights = weights.rename(columns=lambda x: x.strftime("%d-%b-%y"))
 
         weights["Extrapolated"] = p.weights.loc[today]
-        weights["Gap"] = self.weights.loc[today] - p.weights.loc[today]
+        weights["Gap"] = self.__weights_frame.loc[today] - p.weights.loc[today]
         weights.index.name = "Symbol"
         return weights
     #
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+
+class Sectors(object):
+    def __init__(self, assets, **groupings):
+        """
+        Indicator matrix mapping assets to groups, computed once and reused for all aggregations.
+        Assets not listed in a grouping are ignored by it.
+
+        :param assets: list of assets
+        :param groupings: for each grouping a dictionary (or Series) mapping assets to groups,
+                          e.g. Sectors(assets, sector=..., region=..., currency=...)
+        """
+        self.__assets = pd.Index(assets)
+
+        columns = []
+        blocks = []
+        self.__groups = dict()
+        for name, symbolmap in groupings.items():
+            x = self.__groups[name] = pd.Series(symbolmap).reindex(self.__assets).rename(name)
+            groups = sorted(x.dropna().unique())
+            columns += [(name, group) for group in groups]
+            blocks.append(x.values[:, np.newaxis] == np.array(groups, dtype=object)[np.newaxis, :])
+
+        data = np.hstack(blocks).astype(float) if blocks else np.zeros((len(self.__assets), 0))
+        self.__matrix = pd.DataFrame(index=self.__assets, data=data,
+                                     columns=pd.MultiIndex.from_arrays([[c[0] for c in columns], [c[1] for c in columns]]))
+
+    @property
+    def assets(self):
+        """
+        list of assets
+        """
+        return list(self.__assets)
+
+    @property
+    def groupings(self):
+        """
+        names of the groupings
+        """
+        return list(self.__matrix.columns.get_level_values(0).unique())
+
+    def groups(self, grouping):
+        """
+        group of each asset in a grouping, nan for assets not in the grouping
+        """
+        return self.__groups[grouping].copy()
+
+    @property
+    def matrix(self):
+        """
+        frame (assets x (grouping, group)) with a one for each asset in a group
+        """
+        return self.__matrix
+
+    def aggregate(self, weights):
+        """
+        Weights per group for all groupings at once
+
+        :param weights: frame of weights (dates x assets), nan are treated as zero
+        :return: frame of weights (dates x (grouping, group))
+        """
+        w = weights.values
+        matrix = self.__matrix.reindex(index=weights.columns, fill_value=0.0).values
+        return pd.DataFrame(index=weights.index, columns=self.__matrix.columns, data=np.where(np.isnan(w), 0.0, w) @ matrix)
@@ -8,6 +8,7 @@ from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from pyutil.portfolio.portfolio import Portfolio as _Portfolio
+from pyutil.portfolio.sector import Sectors
 from pyutil.sql.base import Base
 from pyutil.sql.interfaces.products import ProductInterface
 from pyutil.sql.interfaces.series import Series
@@ -28,6 +29,9 @@ class Portfolio(ProductInterface):
     _weights_rel = relationship(Series, uselist=False, primaryjoin = ProductInterface.join_series("weight"))
     _weights = association_proxy("_weights_rel", "data", creator=lambda data: Series(name="weight", data=data))
 
+    # the sectors of the symbols, built on first use and dropped whenever the symbols change
+    _sectors = None
+
     def __init__(self, name):
         super().__init__(name)
 
@@ -68,9 +72,15 @@ class Portfolio(ProductInterface):
     def leverage(self):
         return self.portfolio.leverage
 
-    def sector(self, total=False):
-        symbolmap = {s.name : s.group.value for s in self.symbols}
-        return self.portfolio.sector_weights(symbolmap=symbolmap, total=total)
+    @property
+    def sectors(self):
+        if self._sectors is None:
+            self._sectors = Sectors(assets=[s.name for s in self.symbols], sector={s.name: s.group.value for s in self.symbols})
+        return self._sectors
+
+    def sector(self, total=False, sectors=None):
+        sectors = sectors or self.sectors
+        return self.portfolio.sector_weights(symbolmap=sectors, total=total)
 
     @property
     def state(self):
@@ -78,12 +88,13 @@ class Portfolio(ProductInterface):
             return "{0:.2f}%".format(float(100.0 * x)).replace("nan%", "")
 
         frame = self.portfolio.state
+        sectors = self.sectors
 
-        frame["group"] = pd.Series({s.name: s.group.value for s in self.symbols})
+        frame["group"] = sectors.groups("sector")
         frame["internal"] = pd.Series({s.name: s.internal for s in self.symbols})
 
-        sector_weights = frame.groupby(by="group")["Extrapolated"].sum()
-        frame["Sector Weight"] = frame["group"].apply(lambda x: sector_weights[x])
+        sector_weights = sectors.aggregate(frame[["Extrapolated"]].transpose())["sector"].iloc[0]
+        frame["Sector Weight"] = frame["group"].map(sector_weights)
         frame["Relative Sector"] = frame["Extrapolated"] / frame["Sector Weight"]
         frame.index.name = "Symbol"
 
@@ -127,3 +138,11 @@ class PortfolioSymbol(Base):
 
 
 Portfolio.symbols = association_proxy("portfolio_symbol", "symbol")
+
+
+@sq.event.listens_for(PortfolioSymbol.portfolio, "set")
+def _symbols_changed(link, portfolio, old, initiator):
+    # a symbol enters or leaves a portfolio, the sectors are built again for the new symbols
+    for x in (portfolio, old):
+        if isinstance(x, Portfolio):
+            x._sectors = None
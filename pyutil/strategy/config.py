@@ -2,6 +2,8 @@ import abc
 import logging
 import pandas as pd
 
+from pyutil.timeseries.align import align
+
 
 # def reader(session):
 #     from pyutil.sql.interfaces.symbols.symbol import Symbol
@@ -43,7 +45,8 @@ class ConfigMaster(dict):
         return self.__reader
 
     def history(self, t0=pd.Timestamp("2002-01-01")):
-        h = pd.DataFrame({name: self.__reader(name=name) for name in self.__names})
+        # one matrix on the union calendar of all assets
+        h = align({name: self.__reader(name=name) for name in self.__names})
         return h.truncate(before=t0).dropna(axis=0, how="all")
 
     #@property
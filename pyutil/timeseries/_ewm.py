@@ -0,0 +1,113 @@
+import numpy as np
+
+
+def _mean_update(weighted, old_wt, cur, factor):
+    """
+    One step of pandas' recursion for the exponentially weighted mean (adjust=True, ignore_na=False),
+    works for scalars and arrays alike. Start with weighted = nan and old_wt = 1.
+
+    :param weighted: current mean, nan before the first value
+    :param old_wt: current weight of the mean
+    :param cur: new value, may be nan
+    :param factor: decay, e.g. 1 - 1/(1 + com)
+    :return: the new mean and its weight
+    """
+    started = weighted == weighted
+    update = started & (cur == cur)
+    old_wt = np.where(started, old_wt * factor, old_wt)
+
+    # avoid numerical errors on constant series
+    mean = np.where(weighted != cur, (old_wt * weighted + cur) / (old_wt + 1.0), weighted)
+    return np.where(update, mean, np.where(started, weighted, cur)), np.where(update, old_wt + 1.0, old_wt)
+
+
+def _var_update(mean, cov, sum_wt, sum_wt2, old_wt, cur, factor):
+    """
+    One step of pandas' recursion for the exponentially weighted variance, works for scalars and arrays alike.
+    Start with mean = nan, cov = 0 and sum_wt = sum_wt2 = old_wt = 1.
+
+    :return: the new mean, cov, sum_wt, sum_wt2 and old_wt
+    """
+    started = mean == mean
+    update = started & (cur == cur)
+    sum_wt = np.where(started, sum_wt * factor, sum_wt)
+    sum_wt2 = np.where(started, sum_wt2 * (factor * factor), sum_wt2)
+    old_wt = np.where(started, old_wt * factor, old_wt)
+
+    # avoid numerical errors on constant series
+    new_mean = np.where(mean != cur, (old_wt * mean + cur) / (old_wt + 1.0), mean)
+    new_cov = (old_wt * (cov + (mean - new_mean) * (mean - new_mean)) +
+               (cur - new_mean) * (cur - new_mean)) / (old_wt + 1.0)
+
+    return (np.where(update, new_mean, np.where(started, mean, cur)),
+            np.where(update, new_cov, cov),
+            np.where(update, sum_wt + 1.0, sum_wt),
+            np.where(update, sum_wt2 + 1.0, sum_wt2),
+            np.where(update, old_wt + 1.0, old_wt))
+
+
+def _std(cov, sum_wt, sum_wt2):
+    # unbiased standard deviation from the accumulators of _var_update
+    numerator = sum_wt * sum_wt
+    denominator = numerator - sum_wt2
+    var = np.where(denominator > 0, (numerator / denominator) * cov, np.nan)
+    return np.sqrt(np.maximum(var, 0.0))
+
+
+def _ewm_mean(values, coms, min_periods=0):
+    """
+    Exponentially weighted mean of all columns for several centers of mass in one pass,
+    the same recursion as pandas' ewm(com=com, min_periods=min_periods).mean() (adjust=True, ignore_na=False)
+
+    :param values: array of values (n x columns)
+    :param coms: array of centers of mass
+    :param min_periods: minimal number of values to have a mean
+    :return: array of means (coms x n x columns)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n, m = values.shape
+    factor = (1.0 - 1.0 / (1.0 + np.asarray(coms, dtype=np.float64)))[:, np.newaxis]
+
+    output = np.empty((factor.shape[0], n, m))
+    weighted = np.full((factor.shape[0], m), np.nan)
+    old_wt = np.ones_like(weighted)
+    nobs = np.zeros(m, dtype=int)
+
+    with np.errstate(invalid="ignore"):
+        for i in range(n):
+            cur = values[i]
+            nobs += cur == cur
+            weighted, old_wt = _mean_update(weighted, old_wt, cur, factor)
+            output[:, i] = np.where(nobs >= min_periods, weighted, np.nan)
+
+    return output
+
+
+def _ewm_std(values, coms, min_periods=0):
+    """
+    Exponentially weighted (unbiased) standard deviation of all columns for several centers of mass in one pass,
+    the same recursion as pandas' ewm(com=com, min_periods=min_periods).std(bias=False)
+
+    :param values: array of values (n x columns)
+    :param coms: array of centers of mass
+    :param min_periods: minimal number of values to have a standard deviation
+    :return: array of standard deviations (coms x n x columns)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n, m = values.shape
+    factor = (1.0 - 1.0 / (1.0 + np.asarray(coms, dtype=np.float64)))[:, np.newaxis]
+
+    output = np.empty((factor.shape[0], n, m))
+    mean = np.full((factor.shape[0], m), np.nan)
+    cov = np.zeros_like(mean)
+    sum_wt, sum_wt2, old_wt = np.ones_like(mean), np.ones_like(mean), np.ones_like(mean)
+    nobs = np.zeros(m, dtype=int)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i in range(n):
+            cur = values[i]
+            nobs += cur == cur
+            mean, cov, sum_wt, sum_wt2, old_wt = _var_update(mean, cov, sum_wt, sum_wt2, old_wt, cur, factor)
+            output[:, i] = np.where(nobs >= min_periods, _std(cov, sum_wt, sum_wt2), np.nan)
+
+    return output
@@ -0,0 +1,96 @@
+import functools
+
+import numpy as np
+import pandas as pd
+
+
+def union(indexes):
+    """
+    Union calendar of many indexes, e.g. the trading days of assets on different exchanges
+
+    :param indexes: list of indexes
+    :return: sorted index with each date once
+    """
+    indexes = [index for index in indexes if len(index) > 0]
+    if not indexes:
+        return pd.DatetimeIndex([])
+
+    # keep the name if all indexes agree
+    names = set(index.name for index in indexes)
+    name = names.pop() if len(names) == 1 else None
+
+    if all(isinstance(index, pd.DatetimeIndex) and index.tz == indexes[0].tz for index in indexes):
+        # the stable sort of the concatenated (mostly sorted) stamps merges their sorted runs (k-way merge)
+        stamps = np.sort(np.concatenate([index.asi8 for index in indexes]), kind="stable")
+        stamps = stamps[np.concatenate(([True], np.diff(stamps) != 0))]
+        calendar = pd.DatetimeIndex(stamps.view("M8[ns]"), name=name)
+        return calendar.tz_localize("UTC").tz_convert(indexes[0].tz) if indexes[0].tz is not None else calendar
+
+    # e.g. dates, only pandas knows how to compare them
+    return functools.reduce(lambda a, b: a.union(b), indexes).unique().sort_values().rename(name)
+
+
+def __positions(calendar, index):
+    # position of each entry of the index in the calendar, -1 if not in the calendar
+    if isinstance(calendar, pd.DatetimeIndex) and isinstance(index, pd.DatetimeIndex) and calendar.tz == index.tz:
+        stamps, keys = calendar.asi8, index.asi8
+        if len(stamps) == 0:
+            return np.full(len(keys), -1)
+
+        pos = np.minimum(stamps.searchsorted(keys), len(stamps) - 1)
+        return np.where(stamps[pos] == keys, pos, -1)
+
+    return calendar.get_indexer(index)
+
+
+def __stale(calendar, last, limit):
+    # entries older than the limit, last is the position of the last observation for each entry
+    if isinstance(limit, (int, np.integer)):
+        return np.arange(len(calendar))[:, np.newaxis] - last > limit
+
+    stamps = calendar.asi8
+    return (stamps[:, np.newaxis] - stamps[np.maximum(last, 0)]) > pd.Timedelta(limit).value
+
+
+def align(series, calendar=None, ffill=False, limit=None, calendars=None, dtype=np.float64):
+    """
+    Frame of many series on a common calendar, e.g. the prices of hundreds of assets from different exchanges.
+    All values are written into one preallocated matrix, there is no outer join of the series.
+
+    :param series: dictionary name -> series
+    :param calendar: index of the frame, if not specified the union calendar of all series
+    :param ffill: fill missing values with the last value
+    :param limit: do not fill values older than the limit, either a number of dates or a time, e.g. pd.Timedelta(days=5)
+    :param calendars: dictionary name -> index of the dates an asset is traded on, the asset has no value
+                      (not even a filled one) on other dates of the calendar
+    :param dtype: float type of the matrix
+    :return: frame (dates x names)
+    """
+    names = list(series.keys())
+    if calendar is None:
+        calendar = union([series[name].index for name in names])
+
+    matrix = np.full((len(calendar), len(names)), np.nan, dtype=dtype)
+    for j, name in enumerate(names):
+        x = series[name]
+        pos = __positions(calendar, x.index)
+        # entries outside the calendar are dropped
+        inside = pos >= 0
+        matrix[pos[inside], j] = np.asarray(x.values, dtype=dtype)[inside]
+
+    if ffill:
+        # position of the last observation for each entry, -1 before the first observation
+        last = np.where(np.isnan(matrix), -1, np.arange(len(calendar))[:, np.newaxis])
+        np.maximum.accumulate(last, axis=0, out=last)
+
+        if limit is not None:
+            last[__stale(calendar, last, limit)] = -1
+
+        filled = np.take_along_axis(matrix, np.maximum(last, 0), axis=0)
+        matrix = np.where(last >= 0, filled, np.nan).astype(dtype, copy=False)
+
+    for j, name in enumerate(names):
+        if calendars is not None and name in calendars:
+            matrix[~calendar.isin(calendars[name]), j] = np.nan
+
+    return pd.DataFrame(index=calendar, columns=names, data=matrix)
@@ -1,10 +1,49 @@
+import numpy as np
 import pandas as pd
 
 
+def _sorted(ts):
+    return ts.index.is_monotonic_increasing and ts.index.is_unique
+
+
+def _merge_sorted(new, old):
+    # the new values win unless they are missing, both indices are sorted and unique
+    frame = isinstance(new, pd.DataFrame)
+    if frame:
+        columns = new.columns.union(old.columns)
+        new, old = new.reindex(columns=columns), old.reindex(columns=columns)
+
+    # each new entry either replaces an old entry or is inserted in front of the old entry at pos
+    pos = old.index.searchsorted(new.index)
+    present = np.zeros(len(new.index), dtype=bool)
+    inside = pos < len(old.index)
+    present[inside] = old.index[pos[inside]] == new.index[inside]
+
+    a, b = old.values, new.values
+    values = np.array(a, dtype=np.result_type(a, b))
+    replace = pos[present]
+    values[replace] = np.where(pd.isnull(b[present]), values[replace], b[present])
+
+    order = np.insert(np.arange(len(old.index)), pos[~present], len(old.index) + np.arange(np.sum(~present)))
+    index = old.index.append(new.index[~present]).take(order)
+    values = np.concatenate((values, b[~present]))[order]
+
+    if frame:
+        return pd.DataFrame(index=index, columns=columns, data=values)
+    return pd.Series(index=index, data=values, name=new.name if new.name == old.name else None)
+
+
 def merge(new, old=None):
     # very smart merging here, new and old merge
     if new is not None:
         if old is not None:
+            if _sorted(new) and _sorted(old) and isinstance(new.values, np.ndarray) and isinstance(old.values, np.ndarray):
+                # append only, all new entries are after the old ones
+                if new.empty or old.empty or new.index[0] > old.index[-1]:
+                    return pd.concat((old, new), sort=True)
+
+                return _merge_sorted(new, old)
+
             x = pd.concat((new, old), sort=True)
             return x.groupby(x.index).first().sort_index()
         else:
@@ -29,16 +68,59 @@ def first_index(ts, default=None):
         return default
 
 
+def datetime_index(index):
+    """
+    DatetimeIndex of an index of dates, Timestamps, datetime64 or int64 nanoseconds since epoch, converted in bulk
+
+    :param index: index
+    :return: DatetimeIndex (the same object if index is a DatetimeIndex already)
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        return index
+    return pd.DatetimeIndex(pd.to_datetime(index))
+
+
+def date_index(index):
+    """
+    Index of dates (the local dates for a timezone) of an index, converted in bulk
+
+    :param index: index, see datetime_index
+    :return: Index of datetime.date objects
+    """
+    index = datetime_index(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return pd.Index(index.values.astype("M8[D]").astype(object), name=index.name, dtype=object)
+
+
+def epoch(index):
+    """
+    Nanoseconds since epoch (UTC for a timezone) of an index, see datetime_index
+    """
+    return datetime_index(index).asi8
+
+
+def from_epoch(stamps, tz=None):
+    """
+    DatetimeIndex of nanoseconds since epoch
+
+    :param stamps: array of nanoseconds since epoch, UTC for a timezone
+    :param tz: timezone
+    """
+    index = pd.DatetimeIndex(np.asarray(stamps, dtype=np.int64).view("M8[ns]"))
+    return index.tz_localize("UTC").tz_convert(tz) if tz is not None else index
+
+
 def to_datetime(ts=None):
     try:
-        ts.index = pd.to_datetime(ts.index)
+        ts.index = datetime_index(ts.index)
         return ts
     except AttributeError:
         return None
 
 def to_date(ts=None):
     try:
-        ts.index = [a.date() for a in to_datetime(ts).index]
+        ts.index = date_index(ts.index)
         return ts
     except AttributeError:
-        return None
\ No newline at end of file
+        return None
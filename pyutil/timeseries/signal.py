@@ -1,4 +1,9 @@
+from collections import OrderedDict
+
 import numpy as np
+import pandas as pd
+
+from ._ewm import _ewm_mean, _ewm_std, _mean_update, _var_update, _std
 
 
 def __volatility_adjust(prices, com=32, min_periods=50):
@@ -7,7 +12,7 @@ def __volatility_adjust(prices, com=32, min_periods=50):
     return returns / volatility
 
 def __winsorize(data, winsor=4.2):
-    return data.apply(np.clip, a_min=-winsor, a_max=winsor)
+    return data.clip(lower=-winsor, upper=winsor)
 
 
 def __adjprice(prices, vola=32, winsor=4.2, min_periods=50):
@@ -15,16 +20,165 @@ def __adjprice(prices, vola=32, winsor=4.2, min_periods=50):
     return __winsorize(__volatility_adjust(prices, vola, min_periods), winsor=winsor).cumsum()
 
 
-def oscillator(price, a=32, b=96, min_periods=100):
+def _scale(a, b):
     def __geom(q):
         return 1.0 / (1 - q)
 
-    osc = price.ewm(span=2 * a - 1, min_periods=min_periods).mean() - price.ewm(span=2 * b - 1, min_periods=min_periods).mean()
     l_fast = 1.0 - 1.0 / a
     l_slow = 1.0 - 1.0 / b
-    return osc / np.sqrt(__geom(l_fast**2) - 2.0 * __geom(l_slow * l_fast) + __geom(l_slow**2))
+    return np.sqrt(__geom(l_fast**2) - 2.0 * __geom(l_slow * l_fast) + __geom(l_slow**2))
+
+
+def oscillator(price, a=32, b=96, min_periods=100):
+    osc = price.ewm(span=2 * a - 1, min_periods=min_periods).mean() - price.ewm(span=2 * b - 1, min_periods=min_periods).mean()
+    return osc / _scale(a, b)
 
 
 def trend(price, a=32, b=96, vola=32, winsor=4.2, min_periods=50, f=np.tanh):
     return f(oscillator(__adjprice(price, vola, winsor, min_periods), a, b, 2 * min_periods))
 
+
+def trends(prices, grid, min_periods=50, f=np.tanh):
+    """
+    The trend signal of all assets for a grid of parameters in one pass.
+    The volatility adjusted prices are computed once for each (vola, winsor) and shared by all (a, b) pairs,
+    the exponentially weighted means and standard deviations of all assets and parameters share one recursion.
+
+    :param prices: frame of prices (dates x assets)
+    :param grid: list of (a, b, vola, winsor) tuples
+    :param min_periods: as in trend
+    :param f: function applied to the oscillator, e.g. np.tanh
+    :return: frame of signals with columns (a, b, vola, winsor, asset), the same values as trend for each asset
+             and parameters. The values reshape to the tensor (dates x grid x assets).
+    """
+    grid = [tuple(g) for g in grid]
+    x = prices.values.astype(np.float64)
+    n, m = x.shape
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # as pct_change, missing prices are filled with the previous price
+        x = pd.DataFrame(x).ffill().values
+        returns = np.full_like(x, np.nan)
+        returns[1:] = x[1:] / x[:-1] - 1.0
+
+        volas = sorted(set(vola for _, _, vola, _ in grid))
+        std = dict(zip(volas, _ewm_std(returns, volas, min_periods)))
+
+        signals = np.empty((n, len(grid), m))
+        adjusted = OrderedDict()
+        for g, (a, b, vola, winsor) in enumerate(grid):
+            adjusted.setdefault((vola, winsor), []).append(g)
+
+        for (vola, winsor), members in adjusted.items():
+            r = np.clip(returns / std[vola], -winsor, winsor)
+            price = np.where(np.isnan(r), np.nan, np.nancumsum(r, axis=0))
+
+            spans = sorted(set(2 * grid[g][k] - 1 for g in members for k in (0, 1)))
+            means = dict(zip(spans, _ewm_mean(price, [(span - 1) / 2.0 for span in spans], 2 * min_periods)))
+
+            for g in members:
+                a, b = grid[g][0], grid[g][1]
+                signals[:, g] = f((means[2 * a - 1] - means[2 * b - 1]) / _scale(a, b))
+
+    columns = pd.MultiIndex.from_tuples([g + (asset,) for g in grid for asset in prices.columns],
+                                        names=["a", "b", "vola", "winsor", prices.columns.name])
+    return pd.DataFrame(index=prices.index, columns=columns, data=signals.reshape(n, -1))
+
+
+class TrendState(object):
+    def __init__(self, a=32, b=96, vola=32, winsor=4.2, min_periods=50, f=np.tanh):
+        """
+        The trend signal of one asset updated price by price, e.g. for the daily update of a live signal.
+        Each update is O(1) and returns the same value as trend over the full history of prices.
+
+        :param a, b, vola, winsor, min_periods, f: as in trend
+        """
+        self.__a, self.__b, self.__vola, self.__winsor, self.__min_periods = a, b, vola, winsor, min_periods
+        self.__f = f
+
+        self.__price = np.nan
+
+        # accumulators for the volatility of the returns (see _var_update)
+        self.__vola_state = (np.nan, 0.0, 1.0, 1.0, 1.0)
+        self.__vola_nobs = 0
+
+        # the volatility adjusted price and the accumulators of the fast and slow legs of the oscillator
+        self.__cumsum = 0.0
+        self.__fast = (np.nan, 1.0)
+        self.__slow = (np.nan, 1.0)
+        self.__nobs = 0
+
+    def update(self, price):
+        """
+        Add the next price
+
+        :param price: the price, nan is replaced by the previous price (as in pct_change)
+        :return: the signal
+        """
+        if np.isnan(price):
+            price = self.__price
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = price / self.__price - 1.0
+            self.__price = price
+
+            # volatility adjusted and winsorized return
+            self.__vola_nobs += r == r
+            self.__vola_state = tuple(float(x) for x in _var_update(*self.__vola_state, r, 1.0 - 1.0 / (1.0 + self.__vola)))
+
+            volatility = _std(*self.__vola_state[1:4]) if self.__vola_nobs >= self.__min_periods else np.nan
+            r = float(np.clip(r / volatility, -self.__winsor, self.__winsor))
+
+        if r == r:
+            self.__cumsum += r
+            self.__nobs += 1
+        x = self.__cumsum if r == r else np.nan
+
+        # the spans of the legs are 2a - 1 and 2b - 1, e.g. the centers of mass are a - 1 and b - 1
+        self.__fast = tuple(float(y) for y in _mean_update(*self.__fast, x, 1.0 - 1.0 / self.__a))
+        self.__slow = tuple(float(y) for y in _mean_update(*self.__slow, x, 1.0 - 1.0 / self.__b))
+
+        return self.signal
+
+    @property
+    def signal(self):
+        if self.__nobs < 2 * self.__min_periods:
+            return np.nan
+        return float(self.__f((self.__fast[0] - self.__slow[0]) / _scale(self.__a, self.__b)))
+
+    @property
+    def price(self):
+        return self.__price
+
+    def to_series(self):
+        """
+        The parameters and accumulators as a series, e.g. to store the state in the Series table
+        """
+        return pd.Series(OrderedDict([("a", self.__a), ("b", self.__b), ("vola", self.__vola), ("winsor", self.__winsor),
+                                      ("min_periods", self.__min_periods), ("price", self.__price),
+                                      ("vola_mean", self.__vola_state[0]), ("vola_cov", self.__vola_state[1]),
+                                      ("vola_sum_wt", self.__vola_state[2]), ("vola_sum_wt2", self.__vola_state[3]),
+                                      ("vola_old_wt", self.__vola_state[4]), ("vola_nobs", self.__vola_nobs),
+                                      ("cumsum", self.__cumsum), ("fast", self.__fast[0]), ("fast_old_wt", self.__fast[1]),
+                                      ("slow", self.__slow[0]), ("slow_old_wt", self.__slow[1]), ("nobs", self.__nobs)]),
+                         dtype=np.float64)
+
+    @staticmethod
+    def from_series(series, f=np.tanh):
+        """
+        The state stored with to_series
+
+        :param series: series of to_series
+        :param f: function applied to the oscillator
+        """
+        state = TrendState(a=series["a"], b=series["b"], vola=series["vola"], winsor=series["winsor"],
+                           min_periods=int(series["min_periods"]), f=f)
+
+        state.__price = series["price"]
+        state.__vola_state = tuple(float(series[x]) for x in ["vola_mean", "vola_cov", "vola_sum_wt", "vola_sum_wt2", "vola_old_wt"])
+        state.__vola_nobs = int(series["vola_nobs"])
+        state.__cumsum = series["cumsum"]
+        state.__fast = (series["fast"], series["fast_old_wt"])
+        state.__slow = (series["slow"], series["slow_old_wt"])
+        state.__nobs = int(series["nobs"])
+        return state
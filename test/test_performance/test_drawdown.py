@@ -39,4 +39,28 @@ class TestDrawdown(object):
 
     def test_series(self):
         x = pd.Series({0: 3, 1: 2, 2: 1})
-        pdt.assert_series_equal(x, _Drawdown(x).price_series)
\ No newline at end of file
+        pdt.assert_series_equal(x, _Drawdown(x).price_series)
+
+    def test_episodes(self, ts):
+        x = _Drawdown(ts).episodes
+        assert list(x.columns) == ["trough", "recovery", "depth", "duration"]
+
+        e = x.loc[pd.Timestamp("2014-03-07")]
+        assert e["trough"] == pd.Timestamp("2014-03-20")
+        assert e["recovery"] == pd.Timestamp("2014-05-12")
+        assert e["duration"] == pd.Timedelta(days=66)
+        assert e["depth"] == _Drawdown(ts).drawdown.truncate(before="2014-03-07", after="2014-05-11").max()
+
+        # the last drawdown has not recovered yet
+        assert pd.isnull(x["recovery"].iloc[-1])
+        assert x["depth"].iloc[-1] == pytest.approx(0.039885756705666631, 1e-10)
+
+        pdt.assert_frame_equal(_Drawdown(ts).top(n=2), x.sort_values(by="depth", ascending=False).head(2))
+
+    def test_frame(self, ts):
+        frame = pd.DataFrame({"A": ts, "B": ts.truncate(before="2014-04-01"), "C": ts.truncate(after="2015-01-31")})
+        x = _Drawdown(frame).episodes
+        for column in frame.columns:
+            pdt.assert_frame_equal(x.loc[column], _Drawdown(frame[column].dropna()).episodes)
+
+        assert len(_Drawdown(frame).top(n=1).index) == 3
@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pandas.util.testing as pdt
 from pyutil.performance._month import _monthlytable
 from test.config import read
@@ -7,3 +9,17 @@ class TestMonth(object):
     def test_table(self):
         ts = read("ts.csv", squeeze=True, header=None, parse_dates=True)
         pdt.assert_almost_equal(_monthlytable(ts), read("monthtable.csv"))
+
+    def test_panel(self):
+        ts = read("ts.csv", squeeze=True, header=None, parse_dates=True)
+        navs = pd.DataFrame({"A": ts, "B": ts.truncate(before="2014-05-15"), "C": ts.truncate(after="2014-10-31")})
+        x = _monthlytable(navs)
+
+        assert list(x.index.get_level_values(0).unique()) == ["A", "B", "C"]
+        for column in navs.columns:
+            y = _monthlytable(navs[column].dropna())
+            pdt.assert_frame_equal(x.loc[column][y.columns], y)
+
+        # C has no returns after October 2014
+        assert list(x.loc["C"].index) == [2014]
+        assert np.isnan(x.loc[("C", 2014), "Nov"])
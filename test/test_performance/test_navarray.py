@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as pdt
+import pytest
+
+from pyutil.performance.navarray import NavArray
+from pyutil.performance.summary import fromNav
+from test.config import read
+
+
+@pytest.fixture(scope="module")
+def nav():
+    return fromNav(read("ts.csv", parse_dates=True, squeeze=True, header=None), adjust=True)
+
+
+class TestNavArray(object):
+    def test_series(self, nav):
+        x = NavArray.from_series(nav)
+        assert len(x) == len(nav.index)
+        # no copies
+        assert np.shares_memory(x.values, nav.values)
+        assert np.shares_memory(x.to_series().values, x.values)
+
+        pdt.assert_series_equal(x.to_series(), nav, check_names=False, check_freq=False)
+        pdt.assert_index_equal(x.index, nav.index, check_names=False)
+
+    def test_analytics(self, nav):
+        x = NavArray.from_series(nav)
+        np.testing.assert_array_equal(x.returns, nav.returns.values)
+        np.testing.assert_array_equal(x.drawdown, nav.drawdown.values)
+        assert x.periods_per_year == nav.periods_per_year
+        pdt.assert_series_equal(x.summary(), nav.summary())
+        pdt.assert_frame_equal(x.monthlytable, nav.monthlytable)
+
+    def test_truncate(self, nav):
+        x = NavArray.from_series(nav).truncate(before="2015-01-01", after="2015-03-31")
+        y = nav.truncate(before="2015-01-01", after="2015-03-31")
+        np.testing.assert_array_equal(x.values, y.values)
+        assert x.index[0] == y.index[0]
+
+    def test_dates(self):
+        a = pd.Series({pd.Timestamp("2010-01-05").date(): 2.0, pd.Timestamp("2012-02-13").date(): np.nan,
+                       pd.Timestamp("2012-02-14").date(): 4.0})
+        x = NavArray.from_series(a)
+        assert list(x.index) == [pd.Timestamp("2010-01-05"), pd.Timestamp("2012-02-14")]
+
+    def test_tz(self):
+        index = pd.date_range("2018-01-01 09:00", periods=3, freq="H", tz="Europe/Zurich")
+        x = NavArray.from_series(pd.Series(index=index, data=[1.0, 1.1, 1.2]))
+        pdt.assert_index_equal(x.index, index, check_exact=True, exact=False)
+
+    def test_validate(self):
+        with pytest.raises(AssertionError):
+            NavArray(stamps=[2, 1], values=[1.0, 1.0])
+        with pytest.raises(AssertionError):
+            NavArray(stamps=[1, 2], values=[1.0, -1.0])
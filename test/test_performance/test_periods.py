@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 import pandas.util.testing as pdt
 import pytest
 
-from pyutil.performance.periods import periods, period_returns
+from pyutil.performance.periods import periods, period_returns, Period, ReturnIndex
 from test.config import read
 
 
@@ -29,3 +30,38 @@ class TestPeriods(object):
     def test_period_returns_without_periods(self, returns):
         x = 100*period_returns(returns=returns, today=pd.Timestamp("2015-05-01"))
         assert x["Three Years"] == pytest.approx(1.1645579858904798 , 1e-10)
+
+    def test_period_returns_frame(self, returns):
+        frame = pd.DataFrame({"A": returns, "B": -returns, "C": returns.where(returns.index > "2015-01-01")})
+        p = periods(today=returns.index[-1])
+        x = period_returns(frame, offset=p)
+
+        assert list(x.index) == list(p.index)
+        for column in frame.columns:
+            y = pd.Series({key: (frame[column].truncate(before=period.start, after=period.end) + 1.0).prod() - 1.0
+                           for key, period in p.items()})
+            pdt.assert_series_equal(x[column], y, check_names=False)
+
+    def test_return_index(self, returns):
+        # user-defined periods, one of them without any returns
+        p = pd.Series({"Q1": Period(start=pd.Timestamp("2015-01-01"), end=pd.Timestamp("2015-03-31")),
+                       "Empty": Period(start=pd.Timestamp("2020-01-01"), end=pd.Timestamp("2020-12-31"))})
+        x = ReturnIndex(returns).period_returns(p)
+        assert x["Q1"] == pytest.approx(np.prod(returns.truncate(before="2015-01-01", after="2015-03-31") + 1.0) - 1.0, 1e-10)
+        assert x["Empty"] == 0.0
+
+    def test_return_index_loss(self):
+        # returns of -1 and below (e.g. leveraged or short positions) are not dropped
+        index = pd.date_range("2015-01-01", periods=5)
+        frame = pd.DataFrame(index=index, data={"A": [0.0, 0.1, -1.2, 0.1, 0.0],
+                                                "B": [np.nan, 0.1, 0.2, np.nan, -1.0],
+                                                "C": [np.nan, 0.1, 0.2, -0.1, np.nan]})
+        p = pd.Series({"All": Period(start=index[0], end=index[-1]), "Last": Period(start=index[3], end=index[-1])})
+
+        x = period_returns(frame, offset=p)
+        for column in frame.columns:
+            y = pd.Series({key: (frame[column].truncate(before=period.start, after=period.end) + 1.0).prod() - 1.0
+                           for key, period in p.items()})
+            pdt.assert_series_equal(x[column], y, check_names=False)
+
+        assert period_returns(frame["A"], offset=p)["All"] == pytest.approx(-1.242, 1e-10)
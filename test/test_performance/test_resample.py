@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as pdt
+import pytest
+
+from pyutil.performance._resample import _calendar
+from pyutil.performance.summary import fromNav
+from test.config import read
+
+
+@pytest.fixture(scope="module")
+def ts():
+    return read("ts.csv", squeeze=True, header=None, parse_dates=True)
+
+
+class TestResample(object):
+    @pytest.mark.parametrize("rule", ["M", "A", "W"])
+    def test_calendar(self, ts, rule):
+        c = _calendar(ts.index, rule)
+        x = ts.resample(rule).last().dropna()
+        pdt.assert_index_equal(c.labels, x.index)
+        pdt.assert_series_equal(pd.Series(index=c.labels, data=ts.values[c.positions], name=ts.name), x)
+
+        assert c.index[0] == ts.index[0]
+        assert c.index[-1] == ts.index[-1]
+
+    def test_shared(self, ts):
+        # a copy of the index shares the calendar
+        assert _calendar(ts.index, "M") is _calendar(ts.index.copy(), "M")
+        assert _calendar(ts.index, "M") is not _calendar(ts.index[1:], "M")
+        assert _calendar(ts.index, "M") is not _calendar(ts.index, "A")
+
+    def test_monthly(self, ts):
+        x = fromNav(ts).monthly
+        y = pd.concat((ts.head(1), ts.resample("M").last()))
+        assert x.index[-1] == ts.index[-1]
+        np.testing.assert_array_equal(x.values, y.values)
+        np.testing.assert_array_equal(x.index[:-1], y.index[:-1])
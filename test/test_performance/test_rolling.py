@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyutil.performance._rolling import _drawdown
+from pyutil.performance.summary import fromNav, rolling_summary
+from test.config import read
+
+
+@pytest.fixture(scope="module")
+def nav():
+    return fromNav(read("ts.csv", parse_dates=True, squeeze=True, header=None), adjust=True)
+
+
+class TestRolling(object):
+    @pytest.mark.parametrize("years", [1, 3])
+    def test_summary(self, nav, years):
+        x = nav.rolling_summary(years=years)
+        periods = nav.periods_per_year
+
+        for t in nav.index[10::25]:
+            y = nav.truncate(before=t - pd.DateOffset(years=years), after=t).summary(periods=periods)
+            for number in x.columns:
+                assert x[number][t] == pytest.approx(y[number], rel=1e-9, abs=1e-12)
+
+    def test_short(self, nav):
+        x = rolling_summary(nav, min_events=5)
+        assert x.iloc[:5].isnull().all().all()
+        assert x.iloc[5:].notnull().all().all()
+
+    def test_drawdown(self):
+        nav = np.array([10.0, 5.0, 20.0, 19.0, 8.0, 9.0, 30.0])
+        starts = np.array([0, 0, 0, 1, 2, 3, 5])
+        mdd, current = _drawdown(nav, starts)
+        np.testing.assert_allclose(mdd, [0.0, 0.5, 0.5, 0.05, 0.6, 1 - 8.0 / 19.0, 0.0])
+        np.testing.assert_allclose(current, [0.0, 0.5, 0.0, 0.05, 0.6, 1 - 9.0 / 19.0, 0.0])
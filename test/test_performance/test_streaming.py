@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as pdt
+import pytest
+
+from pyutil.performance.streaming import StreamingNav
+from pyutil.performance.summary import fromNav
+from test.config import read
+
+
+@pytest.fixture(scope="module")
+def nav():
+    return fromNav(read("ts.csv", parse_dates=True, squeeze=True, header=None), adjust=True)
+
+
+def stream(nav, **kwargs):
+    s = StreamingNav(**kwargs)
+    for t, value in nav.items():
+        s.update(t, value)
+    return s
+
+
+class TestStreaming(object):
+    def test_summary(self, nav):
+        x = stream(nav).summary()
+        y = nav.summary()
+
+        pdt.assert_index_equal(x.index, y.index)
+        pdt.assert_series_equal(x.drop(["First at", "Last at"]).astype(float),
+                                y.drop(["First at", "Last at"]).astype(float), rtol=1e-10)
+        assert x["First at"] == y["First at"]
+        assert x["Last at"] == y["Last at"]
+
+    def test_intraday(self):
+        rand = np.random.RandomState(0)
+        nav = fromNav(pd.Series(index=pd.date_range("2018-12-31 09:00", periods=3000, freq="min"),
+                                data=np.cumprod(1.0 + 0.001 * rand.standard_normal(3000))))
+
+        s = stream(nav, alpha=0.99, r_f=0.01)
+        pdt.assert_series_equal(s.summary().drop(["First at", "Last at"]).astype(float),
+                                nav.summary(alpha=0.99, r_f=0.01).drop(["First at", "Last at"]).astype(float), rtol=1e-8)
+
+        assert s.nav == nav.iloc[-1]
+        assert s.events == 2999
+        assert s.drawdown == pytest.approx(nav.drawdown.iloc[-1], 1e-10)
+        assert s.max_drawdown == pytest.approx(nav.drawdown.max(), 1e-10)
+
+    def test_long(self):
+        x = pd.Series(index=pd.date_range("2010-01-01", periods=5, freq="365D"), data=[1.0, 1.1, 1.2, 1.1, 1.3])
+        s = stream(x)
+        assert np.isnan(s.summary()["Calmar Ratio (3Y)"])
+        assert s.summary()["Return"] == pytest.approx(30.0, 1e-10)
+
+    def test_increasing(self):
+        s = StreamingNav().update("2018-01-02", 1.0)
+        with pytest.raises(AssertionError):
+            s.update("2018-01-01", 1.0)
+        with pytest.raises(AssertionError):
+            s.update("2018-01-03", -1.0)
@@ -2,7 +2,7 @@ import pandas as pd
 import numpy as np
 import pytest
 
-from pyutil.performance.summary import performance, fromNav, fromReturns
+from pyutil.performance.summary import performance, fromNav, fromReturns, summary_frame
 
 import pandas.util.testing as pdt
 
@@ -143,3 +143,50 @@ class TestSummary(object):
 
         r = fromReturns(None, adjust=True)
         pdt.assert_series_equal(r.series, pd.Series({}))
+
+    @pytest.mark.parametrize("freq", ["D", "B", "W"])
+    def test_summary_numbers(self, freq):
+        # the summary has to agree to the last digit with the numbers computed one by one
+        rand = np.random.RandomState(0)
+        x = pd.Series(index=pd.date_range("2009-02-27", periods=1500, freq=freq),
+                      data=np.cumprod(1.0 + 0.01 * rand.standard_normal(1500)))
+        n = fromNav(x)
+        s = n.summary(r_f=0.01)
+        p = n.periods_per_year
+
+        assert s["Return"] == 100 * ((1 + n.returns).prod() - 1.0)
+        assert s["Annua Volatility"] == 100 * n.annualized_volatility()
+        assert s["Annua Sharpe Ratio (r_f = 0.01)"] == n.sharpe_ratio(periods=p, r_f=0.01)
+        assert s["Max Drawdown"] == 100 * n.drawdown.max()
+        assert s["Current Drawdown"] == 100 * n.drawdown.iloc[-1]
+        assert s["MTD"] == 100 * n.mtd
+        assert s["YTD"] == 100 * n.ytd
+        assert s["Calmar Ratio (3Y)"] == n.calmar_ratio(periods=p, r_f=0.01)
+        assert s["Value at Risk (alpha = 95)"] == 100 * n.var()
+        assert s["Conditional Value at Risk (alpha = 95)"] == 100 * n.cvar()
+        assert s["# Positive Events"] + s["# Negative Events"] == s["# Events"]
+
+    def test_summary_frame(self, nav):
+        rand = np.random.RandomState(1)
+        navs = pd.DataFrame(index=nav.index, data=np.cumprod(1.0 + 0.01 * rand.standard_normal((len(nav.index), 4)), axis=0))
+        navs[0] = nav
+        # different start and end dates
+        navs.iloc[:50, 1] = np.nan
+        navs.iloc[-20:, 2] = np.nan
+        navs.iloc[:10, 3] = np.nan
+        navs.iloc[-30:, 3] = np.nan
+
+        x = summary_frame(navs)
+        assert x.index.name == "Performance number"
+
+        for column in navs.columns:
+            s = fromNav(navs[column]).summary()
+            pdt.assert_index_equal(x.index, s.index)
+            pdt.assert_series_equal(x[column].drop(["First at", "Last at"]).astype(float),
+                                    s.drop(["First at", "Last at"]).astype(float), check_names=False, rtol=1e-10)
+            assert x[column]["First at"] == s["First at"]
+            assert x[column]["Last at"] == s["Last at"]
+
+        # an index of dates is accepted, as by fromNav
+        dates = navs.rename(index=lambda t: t.date())
+        pdt.assert_frame_equal(summary_frame(dates), x)
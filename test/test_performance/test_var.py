@@ -1,6 +1,10 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as pdt
 import pytest
 
 from pyutil.performance._var import _VaR
+from pyutil.performance.summary import value_at_risk
 from test.config import read
 
 
@@ -10,4 +14,28 @@ class TestVar(object):
 
         v = _VaR(ts, alpha=0.99)
         assert 100*v.cvar == pytest.approx(0.51218385609772821, 1e-10)
-        assert 100*v.var == pytest.approx(0.47550914363392316, 1e-10)
\ No newline at end of file
+        assert 100*v.var == pytest.approx(0.47550914363392316, 1e-10)
+
+    def test_alphas(self):
+        ts = read("ts.csv", parse_dates=True, header=None, squeeze=True)
+
+        var, cvar = _VaR(ts)([0.90, 0.95, 0.99])
+        for alpha, v, c in zip([0.90, 0.95, 0.99], var, cvar):
+            assert v == _VaR(ts, alpha=alpha).var
+            assert c == _VaR(ts, alpha=alpha).cvar
+
+        assert 100 * var[2] == pytest.approx(0.47550914363392316, 1e-10)
+        assert 100 * cvar[2] == pytest.approx(0.51218385609772821, 1e-10)
+
+    def test_frame(self):
+        ts = read("ts.csv", parse_dates=True, header=None, squeeze=True)
+        rand = np.random.RandomState(0)
+        navs = pd.DataFrame({"A": ts, "B": ts.where(ts.index > "2014-06-01"),
+                             "C": pd.Series(index=ts.index, data=np.cumprod(1 + 0.01 * rand.standard_normal(len(ts.index))))})
+
+        x = value_at_risk(navs, alphas=[0.95, 0.99])
+        assert list(x.index) == ["Value at Risk (alpha = 95)", "Value at Risk (alpha = 99)",
+                                 "Conditional Value at Risk (alpha = 95)", "Conditional Value at Risk (alpha = 99)"]
+
+        for column in navs.columns:
+            pdt.assert_series_equal(x[column], value_at_risk(navs[column], alphas=[0.95, 0.99]), check_names=False, rtol=1e-10)
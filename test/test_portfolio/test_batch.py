@@ -0,0 +1,70 @@
+import numpy as np
+import pandas.util.testing as pdt
+import pytest
+
+from pyutil.portfolio.batch import PortfolioBatch
+from pyutil.portfolio.portfolio import Portfolio, similar
+from test.config import test_portfolio
+
+
+@pytest.fixture(scope="module")
+def portfolio():
+    return test_portfolio()
+
+
+@pytest.fixture(scope="module")
+def batch(portfolio):
+    weights = [x * portfolio.weights for x in [0.5, 1.0, 2.0]]
+    return PortfolioBatch(prices=portfolio.prices, weights=weights, names=["half", "one", "two"])
+
+
+class TestPortfolioBatch(object):
+    def test_nav(self, portfolio, batch):
+        pdt.assert_series_equal(batch.nav["one"], portfolio.nav.series, check_names=False)
+        pdt.assert_series_equal(batch.leverage["two"], 2 * portfolio.leverage, check_names=False)
+        pdt.assert_series_equal(batch.cash["half"], 1 - 0.5 * portfolio.leverage, check_names=False)
+
+    def test_getitem(self, portfolio, batch):
+        assert similar(batch["one"], portfolio)
+        assert isinstance(batch["two"], Portfolio)
+        assert len(batch) == 3
+
+    def test_summary(self, portfolio, batch):
+        x = batch.summary()
+        y = portfolio.nav.summary()
+        for key in x.index:
+            assert x["one"][key] == pytest.approx(y[key], 1e-10)
+
+        assert x["two"]["Annua Volatility"] == pytest.approx(2 * x["one"]["Annua Volatility"], 1e-2)
+
+    def test_summary_r_f(self, portfolio, batch):
+        x = batch.summary(r_f=0.01)
+        y = portfolio.nav.summary(r_f=0.01)
+        for key in x.index:
+            assert x["one"][key] == pytest.approx(y[key], 1e-10)
+
+        assert x["one"]["Annua Return"] == pytest.approx(batch.summary()["one"]["Annua Return"], 1e-10)
+
+    def test_tensor(self, portfolio):
+        w = np.stack([portfolio.weights.values, portfolio.weights.values])
+        batch = PortfolioBatch(prices=portfolio.prices, weights=w)
+        pdt.assert_series_equal(batch.nav[1], portfolio.nav.series, check_names=False)
+        assert similar(batch[0], portfolio)
+
+    def test_copy(self, portfolio):
+        w = np.stack([portfolio.weights.values, portfolio.weights.values])
+        batch = PortfolioBatch(prices=portfolio.prices, weights=w)
+        nav = batch.nav[0]
+
+        # neither the caller's array nor a portfolio taken from the batch change the batch
+        w[0] = 0.0
+        p = batch[0]
+        p.forward(p.index[-1])
+        assert not p.weights.iloc[-1].equals(portfolio.weights.iloc[-1])
+
+        pdt.assert_series_equal(batch.nav[0], nav)
+        assert similar(batch[0], portfolio)
+
+    def test_mismatch(self, portfolio):
+        with pytest.raises(AssertionError):
+            PortfolioBatch(prices=portfolio.prices, weights=np.zeros((2, 3, 4)))
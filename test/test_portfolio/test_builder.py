@@ -11,8 +11,10 @@ class TestPortfolioBuilder(object):
         prices = pd.DataFrame(columns=["B", "A"], index=[1, 2], data=100)
 
         portfolio = Portfolio(prices=prices)
-        portfolio.weights.loc[1] = {"A": 0.5, "B": 0.5}
-        portfolio.weights.loc[2] = {"A": 0.3, "B": 0.7}
+        weights = portfolio.weights.copy()
+        weights.loc[1] = {"A": 0.5, "B": 0.5}
+        weights.loc[2] = {"A": 0.3, "B": 0.7}
+        portfolio.weights = weights
 
         assert portfolio.prices["A"][2] == 100
         assert portfolio.asset_returns["A"][2] == 0.0
@@ -27,7 +29,9 @@ class TestPortfolioBuilder(object):
 
         portfolio = Portfolio(prices = prices)
 
-        portfolio.weights.loc[1] = {"A": 0.5, "B": 0.4}
+        weights = portfolio.weights.copy()
+        weights.loc[1] = {"A": 0.5, "B": 0.4}
+        portfolio.weights = weights
 
         # forward the weights from the previous state
         portfolio.forward(2)
@@ -35,6 +39,25 @@ class TestPortfolioBuilder(object):
 
         assert portfolio.weights["A"][3] == pytest.approx(0.56521739130434789, 1e-5)
 
+    def test_forward_range(self):
+        prices = pd.DataFrame(columns=["A", "B"], index=[1, 2, 3, 4], data=[[100, 120], [110, 110], [130, 120], [120, 130]])
+
+        portfolio = Portfolio(prices=prices)
+        weights = portfolio.weights.copy()
+        weights.loc[1] = {"A": 0.5, "B": 0.4}
+        portfolio.weights = weights
+
+        portfolio.forward_range(2, 3)
+        assert portfolio.weights["A"][3] == pytest.approx(0.56521739130434789, 1e-5)
+        # we didn't touch the last date
+        assert portfolio.weights["A"][4] == 0.0
+
+        portfolio.forward_range(4)
+        assert portfolio.weights["A"][4] == pytest.approx(0.5294117647058824, 1e-5)
+
+        with pytest.raises(AssertionError):
+            portfolio.forward_range(1)
+
     def test_empty(self):
         portfolio = Portfolio(prices = pd.DataFrame({}))
         #self.assertIsNone(last_index(portfolio.prices))
@@ -45,14 +68,18 @@ class TestPortfolioBuilder(object):
         prices1 = pd.DataFrame(columns=["B", "A"], index=[1, 2], data=100)
 
         portfolio1 = Portfolio(prices=prices1)
-        portfolio1.weights.loc[1] = {"A": 0.5, "B": 0.5}
-        portfolio1.weights.loc[2] = {"A": 0.3, "B": 0.7}
+        weights1 = portfolio1.weights.copy()
+        weights1.loc[1] = {"A": 0.5, "B": 0.5}
+        weights1.loc[2] = {"A": 0.3, "B": 0.7}
+        portfolio1.weights = weights1
 
         prices2 = pd.DataFrame(columns=["C", "D"], index=[1, 2], data=200)
 
         portfolio2 = Portfolio(prices=prices2)
-        portfolio2.weights.loc[1] = {"C": 0.5, "D": 0.5}
-        portfolio2.weights.loc[2] = {"C": 0.3, "D": 0.7}
+        weights2 = portfolio2.weights.copy()
+        weights2.loc[1] = {"C": 0.5, "D": 0.5}
+        weights2.loc[2] = {"C": 0.3, "D": 0.7}
+        portfolio2.weights = weights2
 
         portfolio = merge(portfolios=[portfolio1, portfolio2], axis=1)
 
@@ -61,8 +88,10 @@ class TestPortfolioBuilder(object):
         prices3 = pd.DataFrame(columns=["A", "B"], index=[1, 2], data=200)
 
         portfolio3 = Portfolio(prices=prices3)
-        portfolio3.weights.loc[1] = {"A": 0.5, "B": 0.5}
-        portfolio3.weights.loc[2] = {"A": 0.3, "B": 0.7}
+        weights3 = portfolio3.weights.copy()
+        weights3.loc[1] = {"A": 0.5, "B": 0.5}
+        weights3.loc[2] = {"A": 0.3, "B": 0.7}
+        portfolio3.weights = weights3
 
         with pytest.raises(ValueError):
             # overlapping columns!
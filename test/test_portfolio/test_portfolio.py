@@ -76,10 +76,56 @@ class TestPortfolio(object):
         p1 = portfolio.truncate(before="2015-01-01").iron_threshold(threshold=0.05)
         assert len(p1.trading_days) == 5
 
+    def test_iron_threshold_forward(self, portfolio):
+        # the array engine has to agree with forwarding the portfolio date by date
+        p = portfolio.truncate(before="2015-01-01")
+        p1 = p.iron_threshold(threshold=0.05)
+
+        p2 = p.copy()
+        for yesterday, today in zip(p.index[:-2], p.index[1:-1]):
+            if (p2.weights.loc[today] - p2.weights.loc[yesterday]).abs().max() <= 0.05:
+                p2.forward(today, yesterday=yesterday)
+
+        pdt.assert_frame_equal(p1.weights, p2.weights.astype(float))
+
     def test_iron_time(self, portfolio):
         p2 = portfolio.truncate(before="2014-07-01").iron_time(rule="3M")
         assert len(p2.trading_days) == 4
 
+    @pytest.mark.parametrize("rule", ["3M", "M", "W"])
+    def test_iron_time_forward(self, portfolio, rule):
+        # drifting blocks of weights in one go has to agree with forwarding the portfolio date by date
+        p = portfolio.truncate(before="2014-07-01")
+        p1 = p.iron_time(rule=rule)
+
+        moments = [p.index[0]]
+        for t in p.weights.resample(rule=rule).last().index:
+            moments.append([a for a in p.index if a <= t][-1])
+
+        p2 = p.copy()
+        for date in p.index[:-1]:
+            if date not in moments:
+                p2.forward(date)
+
+        pdt.assert_frame_equal(p1.weights, p2.weights.astype(float))
+
+    def test_forward_range(self, portfolio):
+        p1 = portfolio.truncate(before="2015-01-01").copy()
+        p1.forward_range(start="2015-02-01", end="2015-03-31")
+
+        p2 = portfolio.truncate(before="2015-01-01").copy()
+        for date in p2.index:
+            if pd.Timestamp("2015-02-01") <= date <= pd.Timestamp("2015-03-31"):
+                p2.forward(date)
+
+        pdt.assert_frame_equal(p1.weights, p2.weights)
+
+    def test_iron_time_dates(self, portfolio):
+        p = portfolio.truncate(before="2014-07-01")
+        p1 = p.iron_time(rule=[pd.Timestamp("2014-12-31"), pd.Timestamp("2015-03-31")])
+        # the last day is never touched
+        assert p1.trading_days == [pd.Timestamp("2014-12-31"), pd.Timestamp("2015-03-31"), pd.Timestamp("2015-04-22")]
+
     def test_init_1(self):
         prices = pd.DataFrame(columns=["A", "B"], index=[1, 2, 3], data=[[10.0, 10.0], [15.0, 15.0], [20.0, np.nan]])
         weights = pd.DataFrame(columns=["A", "B"], index=[1, 2, 3], data=[[0.3, 0.7], [0.3, 0.7], [0.3, 0.7]])
@@ -130,6 +176,53 @@ class TestPortfolio(object):
         with pytest.raises(AssertionError):
             Portfolio(prices=prices, weights=weights)
 
+    def test_gap_message(self):
+        prices = pd.DataFrame(index=[0, 1, 2, 3], columns=["A", "B"], data=100)
+        weights = pd.DataFrame(index=[0, 1, 2, 3], columns=["A", "B"], data=[[1, np.nan], [np.nan, 1], [1, 1], [1, np.nan]])
+        with pytest.raises(AssertionError, match=r"\['A'\]"):
+            Portfolio(prices=prices, weights=weights)
+
+    def test_validate(self, portfolio):
+        # trusted callers skip the checks but end up with the same portfolio
+        p = Portfolio(prices=portfolio.prices, weights=portfolio.weights, validate=False)
+        assert similar(p, portfolio)
+
+        x = Portfolio(prices=portfolio.prices, weights=portfolio.weights, dtype=np.float32).truncate(before="2015-01-01")
+        assert x.prices.dtypes.unique() == [np.float32]
+
+    def test_copy_inputs(self, portfolio):
+        # the portfolio owns copies of the arrays, edits made by the caller don't reach the cached results
+        prices, weights = portfolio.prices.copy(), portfolio.weights.copy()
+        p = Portfolio(prices=prices, weights=weights)
+        nav = p.nav.series.copy()
+
+        prices.iloc[-1] = 2 * prices.iloc[-1]
+        weights.iloc[-1] = 2 * weights.iloc[-1]
+        pdt.assert_series_equal(p.nav.series, nav)
+        assert similar(p, portfolio)
+
+    def test_assign_column(self, portfolio):
+        # a column assigned to a frame handed out is not seen by the portfolio nor by the next frame
+        p = portfolio.copy()
+        w = p.weights
+        w["A"] = 0.0
+        pdt.assert_frame_equal(p.weights, portfolio.weights)
+        pdt.assert_series_equal(p.leverage, p.weights.sum(axis=1))
+
+    def test_weight_columns(self):
+        # only the assets given weights are in the weights frame, in their order
+        prices = pd.DataFrame(index=[0, 1, 2], columns=["A", "B", "C"], data=100.0)
+        weights = pd.DataFrame(index=[0, 1, 2], columns=["B", "A"], data=0.5)
+        p = Portfolio(prices=prices, weights=weights)
+        pdt.assert_frame_equal(p.weights, weights)
+        pdt.assert_frame_equal(p.copy().weights, weights)
+        pdt.assert_frame_equal(p.iron_threshold().weights, weights)
+
+        # an asset given its first weight joins the frame
+        p.append(3, prices=pd.Series({"A": 110.0, "B": 110.0, "C": 110.0}), weights=pd.Series({"A": 0.5, "C": 0.5}))
+        assert list(p.weights.columns) == ["B", "A", "C"]
+        assert p.weights["C"].isnull().sum() == 3
+
     def test_weight_current(self, portfolio):
         assert portfolio.weight_current["D"] == pytest.approx(0.022837914929098344, 1e-10)
 
@@ -152,4 +245,92 @@ class TestPortfolio(object):
 
         p2 = Portfolio(weights=2*portfolio.weights, prices=portfolio.prices)
         assert not similar(portfolio, p2)
-        assert similar(portfolio, portfolio)
\ No newline at end of file
+        assert similar(portfolio, portfolio)
+
+    def test_cache(self):
+        p = test_portfolio()
+        nav = p.nav
+        assert p.cache_info.misses == 2
+        assert p.nav is nav
+        assert p.cache_info.hits == 1
+
+        # state and snapshot share the nav and the trading days, the large arrays are not kept
+        p.state
+        p.snapshot()
+        assert p.cache_info.currsize == 3
+
+        # reading the weights keeps the derived results
+        hits = p.cache_info.hits
+        assert similar(p, p)
+        assert p.nav is nav
+        assert p.cache_info.currsize == 3
+        assert p.cache_info.hits == hits + 1
+
+        # weights changed by forwarding the portfolio
+        p.forward(p.index[-1])
+        assert p.cache_info.currsize == 0
+        assert p.nav is not nav
+
+        # weights changed by an assignment
+        leverage = p.leverage
+        p.weights = 2 * p.weights
+        assert p.cache_info.currsize == 0
+        pdt.assert_series_equal(p.leverage, 2 * leverage)
+
+    def test_cache_edit(self, portfolio):
+        # the weights frame is read-only, edits made in place would not be seen by the derived results
+        p = portfolio.copy()
+        leverage = p.leverage
+        with pytest.raises(ValueError):
+            p.weights.iloc[-1] = 2 * p.weights.iloc[-1]
+
+        with pytest.raises(ValueError):
+            p.weights.loc[p.index[-1], "A"] = 0.0
+
+        pdt.assert_series_equal(p.leverage, leverage)
+
+        # a copy of the frame is writable and goes back in with the setter
+        w = p.weights.copy()
+        w.iloc[-1] = 2 * w.iloc[-1]
+        p.weights = w
+        assert p.leverage[-1] == pytest.approx(2 * leverage[-1], 1e-10)
+
+    @pytest.mark.parametrize("warm", [True, False])
+    def test_append(self, portfolio, warm):
+        # appending the last dates one by one gives the same portfolio as building it from scratch
+        n = len(portfolio.index) - 20
+        p = Portfolio(prices=portfolio.prices.iloc[:n].copy(), weights=portfolio.weights.iloc[:n].copy())
+
+        if warm:
+            # the derived results are extended rather than computed again
+            p.trading_days
+            p.leverage
+
+        for t in portfolio.index[n:]:
+            p.append(t, prices=portfolio.prices.loc[t], weights=portfolio.weights.loc[t])
+
+        if warm:
+            assert p.cache_info.currsize == 3
+
+        assert similar(p, portfolio)
+        pdt.assert_series_equal(p.nav, portfolio.nav)
+        pdt.assert_series_equal(p.leverage, portfolio.leverage)
+        pdt.assert_frame_equal(p.position, portfolio.position)
+        pdt.assert_frame_equal(p.asset_returns, portfolio.asset_returns)
+        assert p.trading_days == portfolio.trading_days
+
+    def test_append_gap(self):
+        prices = pd.DataFrame(index=[0, 1, 2], columns=["A", "B"], data=100.0)
+        weights = pd.DataFrame(index=[0, 1, 2], columns=["A", "B"], data=[[0.5, 0.5], [0.5, np.nan], [0.5, np.nan]])
+        p = Portfolio(prices=prices, weights=weights)
+
+        with pytest.raises(AssertionError):
+            p.append(3, prices=pd.Series({"A": 110.0, "B": 110.0}), weights=pd.Series({"A": 0.5, "B": 0.5}))
+
+        with pytest.raises(AssertionError):
+            p.append(2, prices=pd.Series({"A": 110.0}), weights=pd.Series({"A": 0.5}))
+
+        # missing prices are filled
+        p.append(3, prices=pd.Series({"A": 110.0}), weights=pd.Series({"A": 0.5}))
+        assert p.prices["B"][3] == 100.0
+        assert p.nav[3] == pytest.approx(1.05, 1e-10)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as pdt
+import pytest
+
+from pyutil.portfolio.portfolio import Portfolio
+from pyutil.portfolio.sector import Sectors
+from test.config import test_portfolio
+
+sector = {"A": "A", "B": "A", "C": "B", "D": "B", "E": "C", "F": "C", "G": "C"}
+region = {"A": "Europe", "C": "Asia", "E": "Europe", "G": "Asia"}
+
+
+@pytest.fixture(scope="module")
+def portfolio():
+    return test_portfolio()
+
+
+@pytest.fixture(scope="module")
+def sectors(portfolio):
+    return Sectors(assets=portfolio.assets, sector=sector, region=region)
+
+
+class TestSectors(object):
+    def test_matrix(self, sectors):
+        assert sectors.groupings == ["sector", "region"]
+        assert sectors.matrix.shape == (7, 5)
+        assert sectors.matrix[("region", "Asia")]["C"] == 1.0
+        # B has no region
+        assert sectors.matrix.loc["B", "region"].sum() == 0.0
+        assert np.all(sectors.matrix["sector"].sum(axis=1) == 1.0)
+
+    def test_groups(self, sectors):
+        x = sectors.groups("region")
+        assert x["C"] == "Asia"
+        assert np.isnan(x["B"])
+        assert x.name == "region"
+
+    def test_aggregate(self, portfolio, sectors):
+        w = portfolio.weights.ffill()
+        x = sectors.aggregate(w)
+
+        for grouping, symbolmap in [("sector", sector), ("region", region)]:
+            y = w.groupby(by=pd.Series(symbolmap), axis=1).sum()
+            pdt.assert_frame_equal(x[grouping], y, check_names=False)
+
+    def test_group_weights(self, portfolio, sectors):
+        x = portfolio.group_weights(sectors)
+        pdt.assert_frame_equal(x["sector"], portfolio.sector_weights(symbolmap=sector), check_names=False)
+
+        sparse = Portfolio(prices=portfolio.prices, weights=portfolio.weights, sparse=True)
+        pdt.assert_frame_equal(sparse.group_weights(sectors), x)
+
+    def test_sector_weights(self, portfolio):
+        x = Sectors(assets=portfolio.assets, sector=sector)
+        pdt.assert_frame_equal(portfolio.sector_weights(symbolmap=x, total=True),
+                               portfolio.sector_weights(symbolmap=sector, total=True))
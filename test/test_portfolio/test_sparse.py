@@ -0,0 +1,87 @@
+import numpy as np
+import pandas.util.testing as pdt
+import pytest
+
+from pyutil.portfolio._sparse import _SparseWeights
+from pyutil.portfolio.portfolio import Portfolio, similar
+from test.config import test_portfolio
+
+
+@pytest.fixture(scope="module")
+def weights():
+    # assets entering and leaving the portfolio, zero weights in between
+    w = test_portfolio().weights.copy()
+    w.iloc[:20, 0] = np.nan
+    w.iloc[-30:, 1] = np.nan
+    w.iloc[40:60, 2] = 0.0
+    w.iloc[:, 3] = np.nan
+    return w
+
+
+@pytest.fixture(scope="module")
+def portfolios(weights):
+    prices = test_portfolio().prices
+    return Portfolio(prices=prices, weights=weights), Portfolio(prices=prices, weights=weights, sparse=True)
+
+
+symbolmap = {"A": "A", "B": "A", "C": "B", "D": "B", "E": "C", "F": "C"}
+
+
+class TestSparse(object):
+    def test_dense(self, weights):
+        w = _SparseWeights.from_dense(weights.values)
+        np.testing.assert_array_equal(w.todense(), weights.values)
+        assert w.nnz == np.sum(weights.fillna(0.0).values != 0)
+        assert w.first[0] == 20
+        assert w.last[1] == len(weights.index) - 31
+        assert w.last[3] == -1
+
+    def test_nav(self, portfolios):
+        dense, sparse = portfolios
+        assert sparse.sparse
+        pdt.assert_series_equal(sparse.nav, dense.nav)
+        pdt.assert_series_equal(sparse.leverage, dense.leverage)
+        pdt.assert_series_equal(sparse.cash, dense.cash)
+        pdt.assert_frame_equal(sparse.position, dense.position)
+        assert sparse.trading_days == dense.trading_days
+
+    def test_sector_weights(self, portfolios):
+        dense, sparse = portfolios
+        pdt.assert_frame_equal(sparse.sector_weights(symbolmap=symbolmap, total=True),
+                               dense.sector_weights(symbolmap=symbolmap, total=True))
+
+    def test_derived(self, portfolios):
+        dense, sparse = portfolios
+        assert sparse.truncate(before="2015-01-01").sparse
+        assert similar(sparse.tail(10), dense.tail(10))
+        pdt.assert_frame_equal(sparse.weighted_returns, dense.weighted_returns)
+        # still sparse
+        assert sparse.sparse
+
+    def test_weights(self, portfolios):
+        dense, sparse = portfolios
+        # reading the weights (e.g. to compare or store the portfolio) hands out a read-only dense frame,
+        # the portfolio stays sparse
+        pdt.assert_frame_equal(sparse.weights, dense.weights)
+        assert similar(sparse, dense)
+        assert sparse.sparse
+
+        with pytest.raises(ValueError):
+            sparse.weights.iloc[-1] = 0.0
+
+        w = sparse.weights.copy()
+        w.iloc[-1] = 0.0
+        pdt.assert_frame_equal(sparse.weights, dense.weights)
+
+        # the setter changes the weights, the portfolio turns dense
+        p = sparse.copy()
+        p.weights = w
+        assert not p.sparse
+        pdt.assert_frame_equal(p.weights, w)
+
+    def test_densify(self, portfolios):
+        dense, sparse = portfolios
+        p = sparse.copy()
+        p.forward(p.index[-1])
+        assert not p.sparse
+        pdt.assert_frame_equal(p.weights, dense.copy().forward(p.index[-1]).weights)
@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
 from pyutil.sql.interfaces.products import ProductInterface
 from pyutil.sql.interfaces.series import Series
+from pyutil.timeseries.signal import TrendState
 from test.test_sql.product import Product
 
 import pandas.util.testing as pdt
@@ -39,4 +41,14 @@ class TestProductInterface(object):
         pdt.assert_series_equal(p._price.data, pd.Series([1,2,3]))
         pdt.assert_series_equal(p.price, pd.Series([1,2,3]))
 
+    def test_trend_state(self):
+        # the state of a live signal survives a round trip through the table (which sorts the index)
+        state = TrendState(a=8, b=24, vola=16, winsor=3.0, min_periods=20)
+        for price in 100.0 + np.cumsum(np.random.RandomState(0).standard_normal(200)):
+            state.update(price)
 
+        s = Series(name="trend", product2=Product(name="Maffay"), data=state.to_series())
+        restored = TrendState.from_series(s.data)
+
+        pdt.assert_series_equal(restored.to_series(), state.to_series())
+        assert restored.update(101.0) == state.update(101.0)
@@ -58,3 +58,20 @@ class TestPortfolio(object):
     def test_state(self, portfolio):
         pdt.assert_frame_equal(read("state.csv"), portfolio.state, check_names=False, check_exact=False, check_less_precise=True, check_dtype=False)
 
+    def test_sectors(self):
+        p = Portfolio(name="Peter")
+        p.symbols.append(Symbol(name="A", group=SymbolType.equities))
+
+        # built once
+        sectors = p.sectors
+        assert p.sectors is sectors
+
+        # and again once the symbols change
+        p.symbols.append(Symbol(name="B", group=SymbolType.fixed_income))
+        assert p.sectors is not sectors
+        assert p.sectors.assets == ["A", "B"]
+        assert p.sectors.groups("sector")["B"] == "Fixed Income"
+
+        p.symbols.remove(p.symbols[0])
+        assert p.sectors.assets == ["B"]
+
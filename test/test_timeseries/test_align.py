@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as pdt
+
+from pyutil.timeseries.align import align, union
+
+
+def series():
+    a = pd.Series(index=pd.DatetimeIndex(["2015-01-01", "2015-01-02", "2015-01-05", "2015-01-08"]), data=[1.0, 2.0, np.nan, 4.0])
+    b = pd.Series(index=pd.DatetimeIndex(["2015-01-02", "2015-01-03", "2015-01-04"]), data=[10.0, 11.0, 12.0])
+    return {"A": a, "B": b}
+
+
+class TestAlign(object):
+    def test_union(self):
+        x = series()
+        pdt.assert_index_equal(union([x["A"].index, x["B"].index]), x["A"].index.union(x["B"].index))
+        assert union([]).empty
+
+    def test_align(self):
+        x = series()
+        pdt.assert_frame_equal(align(x), pd.DataFrame(x))
+
+    def test_ffill(self):
+        x = series()
+        pdt.assert_frame_equal(align(x, ffill=True), pd.DataFrame(x).ffill())
+        pdt.assert_frame_equal(align(x, ffill=True, limit=1), pd.DataFrame(x).ffill(limit=1))
+
+        # B is not older than one day
+        y = align(x, ffill=True, limit=pd.Timedelta(days=1))
+        assert y["B"][pd.Timestamp("2015-01-05")] == 12.0
+        assert np.isnan(y["B"][pd.Timestamp("2015-01-08")])
+
+    def test_calendars(self):
+        x = series()
+        y = align(x, ffill=True, calendars={"A": pd.DatetimeIndex(["2015-01-01", "2015-01-02", "2015-01-05", "2015-01-08"])})
+
+        pdt.assert_series_equal(y["A"].dropna(), pd.Series(index=x["A"].index, data=[1.0, 2.0, 2.0, 4.0], name="A"))
+        pdt.assert_series_equal(y["B"], pd.DataFrame(x).ffill()["B"])
+
+    def test_calendar(self):
+        x = series()
+        index = pd.DatetimeIndex(["2015-01-02", "2015-01-05"])
+        pdt.assert_frame_equal(align(x, calendar=index), pd.DataFrame(x).reindex(index))
+
+    def test_dates(self):
+        x = {key: value.rename(index=lambda t: t.date()) for key, value in series().items()}
+        pdt.assert_frame_equal(align(x), pd.DataFrame(x))
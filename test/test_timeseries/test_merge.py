@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 import pandas.util.testing as pdt
 import pytest
 
-from pyutil.timeseries.merge import merge, last_index, first_index, to_datetime, to_date
+from pyutil.timeseries.merge import merge, last_index, first_index, to_datetime, to_date, datetime_index, date_index, \
+    epoch, from_epoch
 from test.config import read
 
 
@@ -51,6 +53,49 @@ class TestMerge(object):
         y = merge(pd.Series({}), pd.Series({}))
         pdt.assert_series_equal(y, pd.Series({}))
 
+    def test_merge_overlap(self, ts):
+        old = ts.truncate(after="2015-01-31")
+        new = 2 * ts.truncate(before="2015-01-15")
+        # a missing new value doesn't overwrite the old one
+        new["2015-01-20"] = np.nan
+
+        x = merge(new=new, old=old)
+        assert x.index.equals(ts.index)
+        assert x["2015-01-14"] == ts["2015-01-14"]
+        assert x["2015-01-16"] == 2 * ts["2015-01-16"]
+        assert x["2015-01-20"] == ts["2015-01-20"]
+
+        # same result as grouping all entries by their index
+        y = pd.concat((new, old))
+        pdt.assert_series_equal(x, y.groupby(y.index).first(), check_names=False)
+
+    def test_merge_append(self, ts):
+        x = merge(new=ts.truncate(before="2015-01-01"), old=ts.truncate(after="2014-12-31"))
+        pdt.assert_series_equal(x, ts, check_freq=False)
+
+    def test_merge_frame(self, ts):
+        old = pd.DataFrame({"B": ts, "A": ts}).truncate(after="2015-01-31")
+        new = pd.DataFrame({"C": ts, "A": 2 * ts}).truncate(before="2015-01-15")
+
+        x = merge(new=new, old=old)
+        assert list(x.columns) == ["A", "B", "C"]
+        assert x["A"]["2015-01-14"] == ts["2015-01-14"]
+        assert x["A"]["2015-01-16"] == 2 * ts["2015-01-16"]
+        assert x["B"]["2015-01-16"] == ts["2015-01-16"]
+        assert np.isnan(x["B"]["2015-02-16"])
+
+    def test_merge_dates(self):
+        old = pd.Series({pd.Timestamp("2015-01-01").date(): 1.0, pd.Timestamp("2015-01-03").date(): 3.0})
+        new = pd.Series({pd.Timestamp("2015-01-02").date(): 2.0, pd.Timestamp("2015-01-03").date(): 4.0})
+        pdt.assert_series_equal(merge(new=new, old=old), pd.Series({pd.Timestamp("2015-01-01").date(): 1.0,
+                                                                    pd.Timestamp("2015-01-02").date(): 2.0,
+                                                                    pd.Timestamp("2015-01-03").date(): 4.0}))
+
+    def test_merge_unsorted(self):
+        old = pd.Series(index=[3, 1], data=[3.0, 1.0])
+        new = pd.Series(index=[2, 3], data=[2.0, 4.0])
+        pdt.assert_series_equal(merge(new=new, old=old), pd.Series(index=[1, 2, 3], data=[1.0, 2.0, 4.0]))
+
     def test_to_datetime(self):
 
         t0 = pd.Timestamp("2015-04-22")
@@ -67,4 +112,21 @@ class TestMerge(object):
         assert not to_datetime(None)
         assert not to_date(None)
 
+    def test_index_conversion(self):
+        index = pd.DatetimeIndex(["2015-04-22", "2015-04-23"], name="date")
+        dates = pd.Index([t.date() for t in index], name="date")
+
+        pdt.assert_index_equal(date_index(index), dates)
+        pdt.assert_index_equal(datetime_index(dates), index)
+        assert datetime_index(index) is index
+
+        pdt.assert_index_equal(from_epoch(epoch(dates)), index.rename(None))
+        np.testing.assert_array_equal(epoch(index), index.asi8)
+
+    def test_index_conversion_tz(self):
+        index = pd.DatetimeIndex(["2015-04-22 23:30", "2015-04-23 08:00"]).tz_localize("Europe/Berlin")
+
+        pdt.assert_index_equal(from_epoch(epoch(index), tz="Europe/Berlin"), index)
+        # the local dates
+        assert list(date_index(index)) == [pd.Timestamp("2015-04-22").date(), pd.Timestamp("2015-04-23").date()]
 
@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
+import pandas.util.testing as pdt
 import pytest
 
-from pyutil.timeseries.signal import trend
+from pyutil.timeseries._ewm import _ewm_mean, _ewm_std
+from pyutil.timeseries.signal import trend, trends, TrendState
 from test.config import read
 
 
@@ -11,3 +14,47 @@ class TestSignal(object):
         index = pd.Timestamp("2015-04-14")
 
         assert trend(s)[index] == pytest.approx(-0.06181926927450359, 1e-5)
+
+    def test_trends(self):
+        s = read("ts.csv", squeeze=True, header=None, parse_dates=True)
+        prices = pd.DataFrame({"A": s, "B": s.shift(5) ** 1.5})
+        grid = [(32, 96, 32, 4.2), (8, 24, 32, 4.2), (16, 48, 64, 3.0)]
+
+        x = trends(prices, grid)
+        assert x.shape == (len(prices.index), 6)
+
+        for a, b, vola, winsor in grid:
+            for asset in prices.keys():
+                pdt.assert_series_equal(x[(a, b, vola, winsor, asset)],
+                                        trend(prices[asset], a=a, b=b, vola=vola, winsor=winsor),
+                                        check_names=False)
+
+    def test_ewm(self):
+        x = pd.DataFrame(np.random.RandomState(0).standard_normal((300, 3)).cumsum(axis=0))
+        x.iloc[:20, 1] = np.nan
+        x.iloc[100:120, 2] = np.nan
+
+        mean = _ewm_mean(x.values, [5.0, 31.0], min_periods=10)
+        std = _ewm_std(x.values, [5.0, 31.0], min_periods=10)
+
+        for k, com in enumerate([5.0, 31.0]):
+            np.testing.assert_array_equal(mean[k], x.ewm(com=com, min_periods=10).mean().values)
+            np.testing.assert_array_equal(std[k], x.ewm(com=com, min_periods=10).std(bias=False).values)
+
+    def test_state(self):
+        s = read("ts.csv", squeeze=True, header=None, parse_dates=True)
+        s.iloc[300:305] = np.nan
+
+        state = TrendState(a=8, b=24, vola=16, winsor=3.0, min_periods=20)
+        x = []
+        for i, price in enumerate(s.values):
+            # store and restore the state on the way, a stored series may come back sorted by its index
+            if i == len(s.index) // 2:
+                stored = state.to_series()
+                assert not stored.isnull().all()
+                state = TrendState.from_series(stored.sort_index())
+            x.append(state.update(price))
+
+        pdt.assert_series_equal(pd.Series(index=s.index, data=x), trend(s, a=8, b=24, vola=16, winsor=3.0, min_periods=20), check_names=False)
+        assert state.price == s.iloc[-1]
+        assert state.signal == x[-1]